@@ -29,6 +29,43 @@ from textual.widgets import Footer, Header, Static
 
 from textual_cmdorc import CmdorcController, CmdorcView, HelpScreen, KeyboardHandler
 
+# Demo config written on first launch; pre-encoded once at import
+_DEMO_CONFIG_BYTES = """
+[keyboard]
+shortcuts = { Lint = "1", Format = "2", Tests = "3", "Another Command" = "4" }
+enabled = true
+
+[[command]]
+name = "Lint"
+command = "echo '📝 Linting...'"
+triggers = []
+
+[[command]]
+name = "Format"
+command = "echo '✨ Formatting...'"
+triggers = ["command_success:Lint"]
+
+[[command]]
+name = "Tests"
+command = "echo '🧪 Running tests...'"
+triggers = ["command_success:Format"]
+
+[[command]]
+name = "Another Command"
+command = "echo '🔧 Running another command...'"
+triggers = []
+""".encode()
+
+_DEMO_CONFIG_PATH = Path(__file__).parent.parent / "config.toml"
+
+
+def create_demo_config() -> None:
+    """Create the demo config if missing. Call before the event loop starts."""
+    if not _DEMO_CONFIG_PATH.exists():
+        print(f"Creating demo config at {_DEMO_CONFIG_PATH}...")
+        _DEMO_CONFIG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _DEMO_CONFIG_PATH.write_bytes(_DEMO_CONFIG_BYTES)
+
 
 class StatusPanel(Static):
     """Real-time status display."""
@@ -83,41 +120,13 @@ class DemoDashboard(App):
         self.view = None
         self.keyboard_handler = None
         self._show_log = True
+        self.status_panel = None
+        self._tree = None
 
     def compose(self) -> ComposeResult:
         yield Header()
 
-        # Create a demo config for testing
-        config_path = Path(__file__).parent.parent / "config.toml"
-        if not config_path.exists():
-            print(f"Creating demo config at {config_path}...")
-            config_path.parent.mkdir(parents=True, exist_ok=True)
-            config_path.write_text("""
-[keyboard]
-shortcuts = { Lint = "1", Format = "2", Tests = "3", "Another Command" = "4" }
-enabled = true
-
-[[command]]
-name = "Lint"
-command = "echo '📝 Linting...'"
-triggers = []
-
-[[command]]
-name = "Format"
-command = "echo '✨ Formatting...'"
-triggers = ["command_success:Lint"]
-
-[[command]]
-name = "Tests"
-command = "echo '🧪 Running tests...'"
-triggers = ["command_success:Format"]
-
-[[command]]
-name = "Another Command"
-command = "echo '🔧 Running another command...'"
-triggers = []
-""")
-
+        config_path = _DEMO_CONFIG_PATH
         self.controller = CmdorcController(str(config_path), enable_watchers=False)
         self.view = CmdorcView(self.controller, show_log_pane=self._show_log)
         yield self.view
@@ -127,7 +136,8 @@ triggers = []
 
     async def on_mount(self) -> None:
         """Initialize on app mount."""
-        status_panel = self.query_one("#status", StatusPanel)
+        # Cache the lookup - query_one walks the DOM on every call
+        self.status_panel = self.query_one("#status", StatusPanel)
         try:
             loop = asyncio.get_running_loop()
             self.controller.attach(loop)
@@ -136,9 +146,9 @@ triggers = []
             self.keyboard_handler = KeyboardHandler(self.controller, app=self)
             callbacks = self.keyboard_handler.bind_all()
             if callbacks:
-                status_panel.status = f"✓ Demo initialized - {len(callbacks)} shortcuts - Press 'h' for help"
+                self.status_panel.status = f"✓ Demo initialized - {len(callbacks)} shortcuts - Press 'h' for help"
             else:
-                status_panel.status = "✓ Demo initialized - Press 'h' for help"
+                self.status_panel.status = "✓ Demo initialized - Press 'h' for help"
 
             # Wire events
             self.controller.on_command_started = self._on_command_started
@@ -148,35 +158,40 @@ triggers = []
             self._expand_tree()
 
         except Exception as e:
-            status_panel.status = f"✗ Error: {e}"
+            self.status_panel.status = f"✗ Error: {e}"
 
     def _expand_tree(self) -> None:
         """Expand all top-level tree nodes."""
         try:
-            from textual.widgets import Tree
-
-            tree = self.view.query_one(Tree)
-            # Expand root and all first-level children
-            tree.root.expand()
-            for node in tree.root.children:
-                node.expand()
+            if self._tree is None:
+                from textual.widgets import Tree
+
+                self._tree = self.view.query_one(Tree)
+            tree = self._tree
+            # Snapshot children before expanding - expand() can mutate the
+            # live list, and one local read beats per-iteration lookups
+            children = list(tree.root.children)
+            # Expand root and first-level children behind one repaint
+            # instead of a refresh per expand
+            with self.batch_update():
+                tree.root.expand()
+                for node in children:
+                    node.expand()
         except Exception:
             pass  # Ignore if tree structure is different
 
     async def on_unmount(self) -> None:
         """Cleanup on exit."""
-        if hasattr(self, "controller") and self.controller:
+        if self.controller:
             self.controller.detach()
 
     def _on_command_started(self, name: str, _trigger_source) -> None:
         """Handle command start."""
-        status_panel = self.query_one("#status", StatusPanel)
-        status_panel.status = f"▶ Running {name}..."
+        self.status_panel.status = f"▶ Running {name}..."
 
     def _on_command_finished(self, name: str, _result) -> None:
         """Handle command completion."""
-        status_panel = self.query_one("#status", StatusPanel)
-        status_panel.status = f"✓ {name} finished"
+        self.status_panel.status = f"✓ {name} finished"
 
     async def action_show_help(self) -> None:
         """Show help screen with keyboard shortcuts."""
@@ -192,15 +207,20 @@ triggers = []
         """Toggle log pane visibility."""
         self._show_log = not self._show_log
         if self.view:
-            # Recreate view with new log pane setting
-            old_view = self.view
-            self.view = CmdorcView(self.controller, show_log_pane=self._show_log)
-            await self.mount(self.view, before=old_view)
-            await old_view.remove()
-            self._expand_tree()
+            log_pane = getattr(self.view, "log_pane", None)
+            if log_pane is not None:
+                # Flip visibility in place - just a layout pass, no rebuild
+                log_pane.display = self._show_log
+            else:
+                # Fallback: recreate view with new log pane setting
+                old_view = self.view
+                self.view = CmdorcView(self.controller, show_log_pane=self._show_log)
+                await self.mount(self.view, before=old_view)
+                await old_view.remove()
+                self._tree = None  # Old tree widget was destroyed with the view
+                self._expand_tree()
 
-        status_panel = self.query_one("#status", StatusPanel)
-        status_panel.status = f"Log pane {'shown' if self._show_log else 'hidden'}"
+        self.status_panel.status = f"Log pane {'shown' if self._show_log else 'hidden'}"
 
     async def action_reload_config(self) -> None:
         """Reload configuration."""
@@ -208,13 +228,13 @@ triggers = []
             self.view.refresh_tree()
             self._expand_tree()
 
-        status_panel = self.query_one("#status", StatusPanel)
-        status_panel.status = "✓ Configuration reloaded"
+        self.status_panel.status = "✓ Configuration reloaded"
 
 
 if __name__ == "__main__":
     print("Starting textual-cmdorc demo...")
     print("Press 'q' to quit, 'h' for help, 'l' to toggle log, 'r' to reload")
     print("Keyboard shortcuts: 1=Lint, 2=Format, 3=Tests, 4=Another Command")
+    create_demo_config()  # Blocking I/O happens before the event loop starts
     app = DemoDashboard()
     app.run()
@@ -11,6 +11,8 @@ This example demonstrates:
 """
 
 import asyncio
+import re
+from dataclasses import dataclass
 
 try:
     from textual_cmdorc import CmdorcController
@@ -18,6 +20,18 @@ except ImportError:
     print("Error: Install textual-cmdorc first: pip install textual-cmdorc")
     exit(1)
 
+# Same trigger syntax parsed in cmdorc_frontend.config
+_TRIGGER_RE = re.compile(r"command_success:(.+)")
+
+
+@dataclass(slots=True)
+class CommandOutcome:
+    """Outcome of one command run - slotted, so no per-instance dict."""
+
+    state: str
+    success: bool
+    duration: str
+
 
 class PipelineExecutor:
     """
@@ -32,6 +46,17 @@ class PipelineExecutor:
         self.controller = CmdorcController(config_path, enable_watchers=False)
         self.results = {}
         self.running_commands = set()
+        self._done_events: dict[str, asyncio.Event] = {}
+
+    async def __aenter__(self) -> "PipelineExecutor":
+        """Enter async context: attach and validate once, reuse across runs."""
+        if not await self.setup():
+            raise RuntimeError("Config validation failed")
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Exit async context: detach the controller."""
+        await self.teardown()
 
     async def setup(self):
         """Attach controller to event loop."""
@@ -67,51 +92,83 @@ class PipelineExecutor:
         """
         print(f"\n▶ Executing: {name}")
 
+        # Event is set by _on_finished - no polling needed
+        done = self._done_events[name] = asyncio.Event()
+
         # Request run
         self.controller.request_run(name)
 
         # Wait for completion with timeout
-        start = asyncio.get_event_loop().time()
-        while name in self.running_commands:
-            elapsed = asyncio.get_event_loop().time() - start
-            if elapsed > timeout:
-                print(f"❌ Timeout waiting for {name}")
-                return False
-
-            await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(done.wait(), timeout)
+        except asyncio.TimeoutError:
+            print(f"❌ Timeout waiting for {name}")
+            return False
+        finally:
+            self._done_events.pop(name, None)
 
         result = self.results.get(name)
         if result:
-            success = result.get("success", False)
-            print(f"{'✓' if success else '✗'} {name} → {result.get('state', 'unknown')}")
-            return success
+            print(f"{'✓' if result.success else '✗'} {name} → {result.state}")
+            return result.success
 
         return False
 
+    def _build_parents(self, command_names) -> dict[str, set[str]]:
+        """Build the dependency map (command -> parents) from config triggers."""
+        requested = set(command_names)
+        parents: dict[str, set[str]] = {name: set() for name in command_names}
+
+        runner_config = getattr(self.controller, "runner_config", None)
+        for config in getattr(runner_config, "commands", []):
+            if config.name not in requested:
+                continue
+            for trigger in config.triggers:
+                match = _TRIGGER_RE.match(trigger)
+                if match and match.group(1) in requested:
+                    parents[config.name].add(match.group(1))
+
+        return parents
+
     async def execute_workflow(self, *command_names, parallel: bool = False) -> dict:
         """
-        Execute a sequence of commands.
+        Execute a set of commands, respecting trigger dependencies.
+
+        Commands whose parents (via command_success triggers) have completed
+        are scheduled concurrently with asyncio.gather, so total wall time
+        approaches the critical path length rather than the sum of durations.
 
         Args:
             *command_names: Names of commands to execute
-            parallel: If True, execute all at once; if False, sequential
+            parallel: If True, ignore dependencies and execute all at once
 
         Returns:
             Dict mapping command names to results
         """
         if parallel:
-            # Execute all commands concurrently
+            parents = {name: set() for name in command_names}
             print(f"\n▶ Executing {len(command_names)} commands in parallel...")
-            tasks = [self.execute_command(name) for name in command_names]
-            await asyncio.gather(*tasks)
         else:
-            # Execute sequentially
-            print(f"\n▶ Executing {len(command_names)} commands sequentially...")
-            for name in command_names:
-                success = await self.execute_command(name)
+            parents = self._build_parents(command_names)
+            print(f"\n▶ Executing {len(command_names)} commands (dependency order)...")
+
+        pending = set(command_names)
+        done: set[str] = set()
+
+        while pending:
+            ready = [name for name in pending if parents[name] <= done]
+            if not ready:
+                print(f"⚠️ Dependency cycle or missing parent for: {', '.join(sorted(pending))}")
+                break
+
+            successes = await asyncio.gather(*(self.execute_command(name) for name in ready))
+            for name, success in zip(ready, successes, strict=True):
                 if not success:
                     print(f"⚠️ {name} failed, continuing anyway...")
 
+            done.update(ready)
+            pending.difference_update(ready)
+
         return self.results
 
     async def teardown(self):
@@ -125,44 +182,42 @@ class PipelineExecutor:
     def _on_finished(self, name: str, result):
         """Handler for command completion."""
         self.running_commands.discard(name)
-        self.results[name] = {
-            "state": result.state.value,
-            "success": result.state.value == "success",
-            "duration": getattr(result, "duration_str", "?"),
-        }
+        state = result.state.value
+        self.results[name] = CommandOutcome(
+            state=state,
+            success=state == "success",
+            duration=getattr(result, "duration_str", "?"),
+        )
+
+        # Wake up any execute_command() waiting on this command
+        done = self._done_events.get(name)
+        if done:
+            done.set()
 
 
-async def example_ci_pipeline():
+async def example_ci_pipeline(executor: PipelineExecutor):
     """Example: CI pipeline execution."""
     print("=" * 60)
     print("Example 1: CI Pipeline Execution")
     print("=" * 60)
 
-    executor = PipelineExecutor("config.toml")
-
-    if not await executor.setup():
-        return
+    executor.results.clear()
 
     # Run CI pipeline: Lint → Format → Test
     await executor.execute_workflow("Lint", "Format", "Test", parallel=False)
 
     print("\n📊 Results:")
     for cmd, result in executor.results.items():
-        print(f"  {cmd}: {result['state']} ({result['duration']})")
-
-    await executor.teardown()
+        print(f"  {cmd}: {result.state} ({result.duration})")
 
 
-async def example_deployment():
+async def example_deployment(executor: PipelineExecutor):
     """Example: Production deployment with safety checks."""
     print("\n" + "=" * 60)
     print("Example 2: Production Deployment")
     print("=" * 60)
 
-    executor = PipelineExecutor("config.toml")
-
-    if not await executor.setup():
-        return
+    executor.results.clear()
 
     # Deployment pipeline: Build → Test → Deploy
     pipeline = ["Build", "Test", "Deploy"]
@@ -182,19 +237,14 @@ async def example_deployment():
     else:
         print("\n✓ Deployment completed successfully!")
 
-    await executor.teardown()
 
-
-async def example_monitoring():
+async def example_monitoring(executor: PipelineExecutor):
     """Example: Continuous monitoring task."""
     print("\n" + "=" * 60)
     print("Example 3: Health Check Monitoring")
     print("=" * 60)
 
-    executor = PipelineExecutor("config.toml")
-
-    if not await executor.setup():
-        return
+    executor.results.clear()
 
     # Run health check periodically
     print("\n▶ Running health checks (3 iterations)...")
@@ -207,9 +257,7 @@ async def example_monitoring():
 
     print("\n📊 Health check history:")
     for _cmd, result in executor.results.items():
-        print(f"  {result['state']}: {result['duration']}")
-
-    await executor.teardown()
+        print(f"  {result.state}: {result.duration}")
 
 
 async def main():
@@ -220,14 +268,16 @@ async def main():
     print("╚════════════════════════════════════════════════════════════╝")
 
     try:
-        # Example 1: Basic CI pipeline
-        await example_ci_pipeline()
+        # One executor shared across examples: attach + config load happen once
+        async with PipelineExecutor("config.toml") as executor:
+            # Example 1: Basic CI pipeline
+            await example_ci_pipeline(executor)
 
-        # Example 2: Deployment with checks
-        # await example_deployment()
+            # Example 2: Deployment with checks
+            # await example_deployment(executor)
 
-        # Example 3: Monitoring
-        # await example_monitoring()
+            # Example 3: Monitoring
+            # await example_monitoring(executor)
 
     except KeyboardInterrupt:
         print("\n\n⚠️ Interrupted by user")
@@ -2,9 +2,7 @@
 
 __version__ = "0.1.0"
 
-# Models
-# Config
-from cmdorc_frontend.config import load_frontend_config
+# Models (lightweight - safe to import eagerly)
 from cmdorc_frontend.models import (
     VALID_KEYS,
     CommandNode,
@@ -15,8 +13,14 @@ from cmdorc_frontend.models import (
     map_run_state_to_icon,
 )
 
-# State management
-from cmdorc_frontend.state_manager import CommandView, StateReconciler
+# Heavier modules (config parsing, state machinery) are loaded lazily via
+# PEP 562 so that `import cmdorc_frontend` doesn't drag in tomllib and
+# cmdorc's loader until they're actually used.
+_LAZY_IMPORTS = {
+    "load_frontend_config": "cmdorc_frontend.config",
+    "CommandView": "cmdorc_frontend.state_manager",
+    "StateReconciler": "cmdorc_frontend.state_manager",
+}
 
 __all__ = [
     "__version__",
@@ -34,3 +38,16 @@ __all__ = [
     # Config
     "load_frontend_config",
 ]
+
+
+def __getattr__(name: str):
+    """Resolve lazy exports on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # Cache so subsequent access skips __getattr__
+    return value
@@ -1,26 +1,32 @@
 """Configuration parsing for cmdorc frontend."""
 
 import logging
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-
-try:
-    import tomllib
-except ImportError:
-    import tomli as tomllib  # type: ignore
-
-from cmdorc import RunnerConfig, load_config
+from typing import TYPE_CHECKING
 
 from cmdorc_frontend.models import CommandNode, KeyboardConfig
 from cmdorc_frontend.watchers import WatcherConfig
 
+if TYPE_CHECKING:
+    from cmdorc import CommandConfig, RunnerConfig
+
 logger = logging.getLogger(__name__)
 
+# Lifecycle triggers that link a command to its parent in the hierarchy
+_TRIGGER_PREFIXES = frozenset({"command_success", "command_failed", "command_cancelled"})
+
 
 def load_frontend_config(
     path: str | Path,
-) -> tuple[RunnerConfig, KeyboardConfig, list[WatcherConfig], list[CommandNode]]:
+) -> tuple["RunnerConfig", KeyboardConfig, list[WatcherConfig], list[CommandNode]]:
     """Load configuration for any frontend.
 
+    Parsed results are cached per (path, mtime), so multiple frontends
+    sharing one config file only pay for parsing once. Callers should
+    treat the returned structures as immutable.
+
     Args:
         path: Path to TOML config file
 
@@ -35,10 +41,29 @@ def load_frontend_config(
             f"Config file not found: {path}\nRun 'cmdorc-tui' without arguments to auto-create a default config."
         )
 
-    # Load TOML content
+    return _load_frontend_config_cached(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _load_frontend_config_cached(
+    path_str: str, mtime_ns: int
+) -> tuple["RunnerConfig", KeyboardConfig, list[WatcherConfig], list[CommandNode]]:
+    """Parse a config file; cached on (path, mtime) so edits invalidate."""
+    # Imported here so `import cmdorc_frontend.config` stays cheap - the
+    # TOML parser and cmdorc's loader are only paid for on first parse
     try:
-        with open(path) as f:
-            raw = tomllib.loads(f.read())
+        import tomllib
+    except ImportError:
+        import tomli as tomllib  # type: ignore
+
+    from cmdorc import load_config
+
+    path = Path(path_str)
+
+    # Load TOML content (binary mode - tomllib does its own UTF-8 decode)
+    try:
+        with open(path, "rb") as f:
+            raw = tomllib.load(f)
     except Exception as e:
         raise ValueError(f"Failed to parse config file {path}: {e}") from e
 
@@ -50,13 +75,13 @@ def load_frontend_config(
         show_in_tooltips=keyboard_raw.get("show_in_tooltips", True),
     )
 
-    # Parse watchers
+    # Parse watchers (tuple fields - WatcherConfig is a frozen value object)
     watchers = [
         WatcherConfig(
             dir=path.parent / Path(w["dir"]),
-            patterns=w.get("patterns"),
-            extensions=w.get("extensions"),
-            ignore_dirs=w.get("ignore_dirs", ["__pycache__", ".git"]),
+            patterns=tuple(w["patterns"]) if "patterns" in w else None,
+            extensions=tuple(w["extensions"]) if "extensions" in w else None,
+            ignore_dirs=tuple(w.get("ignore_dirs", ("__pycache__", ".git"))),
             trigger=w["trigger"],
             debounce_ms=w.get("debounce_ms", 300),
         )
@@ -67,44 +92,91 @@ def load_frontend_config(
     runner_config = load_config(path)
 
     # Build hierarchy from runner config
-    import re
-
-    from cmdorc import CommandConfig
-
     commands: dict[str, CommandConfig] = {c.name: c for c in runner_config.commands}
-    graph: dict[str, list[str]] = {name: [] for name in commands}
+    # defaultdict skips pre-allocating an empty child list for every leaf
+    graph: defaultdict[str, list[str]] = defaultdict(list)
+    in_degree: dict[str, int] = dict.fromkeys(commands, 0)
 
+    # Single pass computes both edges and in-degrees (Kahn-style), so root
+    # discovery below needs no flattening of the child lists
     for name, config in commands.items():
         for trigger in config.triggers:
-            match = re.match(r"(command_success|command_failed|command_cancelled):(.+)", trigger)
-            if match:
-                trigger_type, parent = match.groups()
-                if parent in graph:
-                    graph[parent].append(name)
+            prefix, sep, parent = trigger.partition(":")
+            if sep and prefix in _TRIGGER_PREFIXES and parent in commands:
+                graph[parent].append(name)
+                in_degree[name] += 1
 
     visited: set[str] = set()
     roots: list[CommandNode] = []
 
-    def build_node(name: str, visited_local: set[str]) -> CommandNode | None:
-        if name in visited_local:
-            logger.warning(f"Cycle detected at {name}, skipping duplicate")
-            return None
-        visited_local.add(name)
-        node = CommandNode(config=commands[name])
-        for child_name in graph.get(name, []):
-            child_node = build_node(child_name, visited_local.copy())
-            if child_node:
-                node.children.append(child_node)
-        return node
-
-    all_children = {c for children in graph.values() for c in children}
-    potential_roots = [name for name in commands if name not in all_children]
-
-    for root_name in potential_roots:
-        if root_name not in visited:
-            root_node = build_node(root_name, set())
-            if root_node:
-                roots.append(root_node)
-                visited.add(root_name)
+    # The completed-subtree memo below is only sound on acyclic graphs:
+    # with a cycle, per-path pruning can give the same command different
+    # children on different paths, so a cached node from one path would be
+    # wrong on another. A Kahn pass over the in-degrees detects cycles up
+    # front; cyclic (misconfigured) graphs fall back to plain per-path
+    # expansion, which matches the original recursive behavior exactly.
+    remaining = dict(in_degree)
+    queue = [name for name, degree in remaining.items() if degree == 0]
+    while queue:
+        for child in graph.get(queue.pop(), ()):
+            remaining[child] -= 1
+            if remaining[child] == 0:
+                queue.append(child)
+    acyclic = not any(remaining.values())
+
+    built: dict[str, CommandNode] = {}
+
+    def build_node(root_name: str) -> CommandNode:
+        # Iterative DFS: explicit stack of (node, child iterator) plus a
+        # single `path` set for the names currently on the stack (add on
+        # push, discard on pop) - no recursion frames or per-edge copies
+        if root_name in built:
+            return built[root_name]
+        root_node = CommandNode(config=commands[root_name])
+        path: set[str] = {root_name}
+        stack = [(root_name, root_node, iter(graph.get(root_name, ())))]
+        while stack:
+            name, node, children = stack[-1]
+            child_name = next(children, None)
+            if child_name is None:
+                stack.pop()
+                path.discard(name)
+                if acyclic:
+                    built[name] = node
+                continue
+            if child_name in path:
+                logger.warning("Cycle detected at %s, skipping duplicate", child_name)
+                continue
+            cached = built.get(child_name)
+            if cached is not None:
+                # Completed subtree - reuse it (graph may be a DAG, not a tree)
+                node.children.append(cached)
+                continue
+            child_node = CommandNode(config=commands[child_name])
+            node.children.append(child_node)
+            path.add(child_name)
+            stack.append((child_name, child_node, iter(graph.get(child_name, ()))))
+        return root_node
+
+    # Roots are the zero in-degree commands; dict order keeps TOML order
+    for root_name, degree in in_degree.items():
+        if degree == 0 and root_name not in visited:
+            roots.append(build_node(root_name))
+            visited.add(root_name)
+
+    # Hierarchy is final from here on - freeze children to tuples (smaller,
+    # faster to iterate) and warm the cached preorder traversals so UI
+    # refreshes never pay for a tree walk
+    frozen: set[int] = set()
+    stack = list(roots)
+    while stack:
+        node = stack.pop()
+        if id(node) in frozen:
+            continue
+        frozen.add(id(node))
+        node.children = tuple(node.children)
+        stack.extend(node.children)
+    for root in roots:
+        root.iter_preorder()
 
     return runner_config, keyboard_config, watchers, roots
@@ -2,8 +2,10 @@
 
 import asyncio
 import logging
-from pathlib import Path
-from threading import Timer
+import os
+import time
+from functools import lru_cache
+from os.path import basename
 
 from cmdorc import CommandOrchestrator
 from watchdog.events import FileSystemEvent, FileSystemEventHandler
@@ -14,6 +16,32 @@ from cmdorc_frontend.watchers import WatcherConfig
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _cached_match(
+    name: str,
+    suffix: str,
+    ext_set: frozenset | None,
+    pattern_suffixes: frozenset,
+    pattern_tails: tuple,
+    has_patterns: bool,
+) -> bool:
+    """Filter check memoized on (file, frozen filters).
+
+    Bursty tools rewrite the same few files many times inside a debounce
+    window; repeats become a single cache hit instead of re-evaluation.
+    """
+    # Check extensions if specified (O(1) hashed lookup)
+    if ext_set is not None and suffix not in ext_set:
+        return False
+
+    # Check patterns if specified (simple suffix matching, precomputed
+    # into a suffix set for "*.x" and an endswith tuple for "**/*x")
+    if has_patterns:
+        return suffix in pattern_suffixes or name.endswith(pattern_tails)
+
+    return True
+
+
 class _DebouncedHandler(FileSystemEventHandler):
     """Debounced file system event handler."""
 
@@ -23,8 +51,10 @@ class _DebouncedHandler(FileSystemEventHandler):
         orchestrator: CommandOrchestrator,
         loop: asyncio.AbstractEventLoop,
         debounce_ms: int,
-        patterns: list[str] | None = None,
-        extensions: list[str] | None = None,
+        patterns: tuple[str, ...] | None = None,
+        extensions: tuple[str, ...] | None = None,
+        ignore_dirs: tuple[str, ...] | None = None,
+        fire_gate=None,
     ):
         """Initialize handler.
 
@@ -35,6 +65,10 @@ class _DebouncedHandler(FileSystemEventHandler):
             debounce_ms: Debounce delay in milliseconds
             patterns: Optional glob patterns to match
             extensions: Optional extensions to match
+            ignore_dirs: Optional directory names whose events are dropped
+            fire_gate: Optional callable(trigger_name, debounce_s) -> bool
+                consulted before firing; lets the manager coalesce duplicate
+                fires of one trigger across watchers
         """
         self.trigger_name = trigger_name
         self.orchestrator = orchestrator
@@ -42,68 +76,102 @@ class _DebouncedHandler(FileSystemEventHandler):
         self.debounce_ms = debounce_ms
         self.patterns = patterns
         self.extensions = extensions
-        self._timer: Timer | None = None
-
-    def _matches_filters(self, path: Path) -> bool:
-        """Check if path matches configured filters.
+        self._debounce_s = debounce_ms / 1000.0
+        self._deadline: float | None = None
+        self._task: asyncio.Task | None = None  # Created/read on loop thread only
+        self._fire_gate = fire_gate
+
+        # Precomputed filter structures - _matches_filters is the per-event
+        # hot path, so membership tests are hashed and endswith gets a tuple
+        self._ext_set = frozenset(extensions) if extensions else None
+        self._has_patterns = bool(patterns)
+        self._pattern_suffixes = frozenset(p[1:] for p in patterns or [] if p.startswith("*."))
+        self._pattern_tails = tuple(p[4:] for p in patterns or [] if p.startswith("**/*"))
+        # Ignored directories become substring tokens tested against the raw
+        # event path - one C-level scan each, no path splitting per event
+        sep = os.sep
+        self._ignore_tokens = tuple(f"{sep}{d}{sep}" for d in ignore_dirs) if ignore_dirs else ()
+
+    def _matches_filters(self, name: str, suffix: str) -> bool:
+        """Check if a file name/suffix matches configured filters.
 
         Args:
-            path: Path to check
+            name: File base name (no directory components)
+            suffix: File extension including the dot, or ""
 
         Returns:
-            True if path matches filters
+            True if the file matches filters
         """
-        # Check extensions if specified
-        if self.extensions and path.suffix not in self.extensions:
-            return False
-
-        # Check patterns if specified (simple suffix matching)
-        if self.patterns:
-            matched = False
-            for pattern in self.patterns:
-                # Simple pattern matching - just check if path ends with pattern suffix
-                if pattern.startswith("**/*"):
-                    suffix = pattern[4:]  # Remove "**/*"
-                    if path.name.endswith(suffix):
-                        matched = True
-                        break
-                elif pattern.startswith("*."):
-                    if path.suffix == pattern[1:]:
-                        matched = True
-                        break
-            if not matched:
-                return False
+        return _cached_match(
+            name, suffix, self._ext_set, self._pattern_suffixes, self._pattern_tails, self._has_patterns
+        )
 
-        return True
+    def _is_ignored(self, src: str) -> bool:
+        """Check whether the event path sits under an ignored directory."""
+        return any(token in src for token in self._ignore_tokens)
 
     def _schedule_trigger(self) -> None:
-        """Schedule trigger after debounce delay."""
-        # Cancel existing timer
-        if self._timer:
-            self._timer.cancel()
-
-        # Schedule new trigger
-        def fire_trigger():
-            """Fire trigger on event loop."""
-            try:
-                self.loop.call_soon_threadsafe(
-                    lambda: asyncio.create_task(self.orchestrator.trigger(self.trigger_name))
-                )
-                logger.debug(f"Triggered '{self.trigger_name}' from file change")
-            except Exception as e:
-                logger.error(f"Failed to trigger '{self.trigger_name}': {e}")
-
-        self._timer = Timer(self.debounce_ms / 1000.0, fire_trigger)
-        self._timer.start()
+        """Extend the debounce deadline and ensure the debounce task is running.
+
+        Called from watchdog's observer thread. Bursty event storms cost one
+        float write each instead of a fresh Timer thread per event.
+        """
+        self._deadline = time.monotonic() + self._debounce_s
+        try:
+            self.loop.call_soon_threadsafe(self._ensure_debounce_task)
+        except Exception as e:
+            logger.error("Failed to schedule trigger '%s': %s", self.trigger_name, e)
+
+    def _ensure_debounce_task(self) -> None:
+        """Start the debounce task if one isn't already waiting (loop thread)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._debounce_loop())
+
+    async def _debounce_loop(self) -> None:
+        """Sleep until the (possibly extended) deadline, then fire the trigger."""
+        while True:
+            deadline = self._deadline
+            remaining = 0.0 if deadline is None else deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            # New events just move the deadline; re-check after sleeping
+            await asyncio.sleep(remaining)
+
+        self._deadline = None
+        if self._fire_gate is not None and not self._fire_gate(self.trigger_name, self._debounce_s):
+            logger.debug("Coalesced duplicate fire of '%s'", self.trigger_name)
+            return
+        try:
+            task = asyncio.create_task(self.orchestrator.trigger(self.trigger_name))
+            task.add_done_callback(self._log_trigger_result)
+            logger.debug("Triggered '%s' from file change", self.trigger_name)
+        except Exception as e:
+            logger.error("Failed to trigger '%s': %s", self.trigger_name, e)
+
+    def _log_trigger_result(self, task: asyncio.Task) -> None:
+        """Surface exceptions from a fired trigger instead of dropping them."""
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:
+            logger.error("Trigger '%s' raised: %s", self.trigger_name, exc)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events."""
         if event.is_directory:
             return
 
-        path = Path(event.src_path)
-        if self._matches_filters(path):
-            logger.debug(f"File change detected: {path}")
+        # Split name/suffix from the raw string - Path() construction is too
+        # expensive for the per-event hot path
+        src = event.src_path
+        if self._is_ignored(src):
+            return
+        name = basename(src)
+        dot = name.rfind(".")
+        suffix = name[dot:] if dot >= 0 else ""
+        if self._matches_filters(name, suffix):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File change detected: %s", src)
             self._schedule_trigger()
 
     def on_created(self, event: FileSystemEvent) -> None:
@@ -111,12 +179,37 @@ class _DebouncedHandler(FileSystemEventHandler):
         if event.is_directory:
             return
 
-        path = Path(event.src_path)
-        if self._matches_filters(path):
-            logger.debug(f"File created: {path}")
+        src = event.src_path
+        if self._is_ignored(src):
+            return
+        name = basename(src)
+        dot = name.rfind(".")
+        suffix = name[dot:] if dot >= 0 else ""
+        if self._matches_filters(name, suffix):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("File created: %s", src)
             self._schedule_trigger()
 
 
+class _MultiplexedHandler(FileSystemEventHandler):
+    """Fans one observer watch out to multiple debounced handlers.
+
+    Watcher configs sharing a directory get a single inotify watch instead
+    of one kernel-side watch (and duplicate event delivery) per config.
+    """
+
+    def __init__(self) -> None:
+        self.targets: list[_DebouncedHandler] = []
+
+    def on_modified(self, event: FileSystemEvent) -> None:
+        for target in self.targets:
+            target.on_modified(event)
+
+    def on_created(self, event: FileSystemEvent) -> None:
+        for target in self.targets:
+            target.on_created(event)
+
+
 class FileWatcherManager:
     """Manages file watchers for SimpleApp."""
 
@@ -131,6 +224,22 @@ class FileWatcherManager:
         self.loop = loop
         self.observer = Observer()
         self.handlers: list[_DebouncedHandler] = []
+        self._schedules: dict[tuple[str, bool], _MultiplexedHandler] = {}
+        self._last_fired: dict[str, float] = {}
+
+    def _should_fire(self, trigger_name: str, debounce_s: float) -> bool:
+        """Coalesce fires of one trigger across watchers (loop thread only).
+
+        Several watchers can share a trigger name; when their debounce
+        windows flush together only the first fire within the window goes
+        through to the orchestrator.
+        """
+        now = time.monotonic()
+        last = self._last_fired.get(trigger_name)
+        if last is not None and now - last < debounce_s:
+            return False
+        self._last_fired[trigger_name] = now
+        return True
 
     def add_watch(self, config: WatcherConfig) -> None:
         """Add a file watcher.
@@ -139,7 +248,7 @@ class FileWatcherManager:
             config: Watcher configuration
         """
         if not config.dir.exists():
-            logger.warning(f"Watcher directory does not exist: {config.dir}")
+            logger.warning("Watcher directory does not exist: %s", config.dir)
             return
 
         # Create debounced handler
@@ -150,13 +259,21 @@ class FileWatcherManager:
             debounce_ms=config.debounce_ms,
             patterns=config.patterns,
             extensions=config.extensions,
+            ignore_dirs=config.ignore_dirs,
+            fire_gate=self._should_fire,
         )
 
-        # Schedule watch
-        self.observer.schedule(handler, str(config.dir), recursive=True)
+        # Schedule one observer watch per (dir, recursive); additional
+        # configs on the same directory reuse the existing watch
+        key = (str(config.dir), True)
+        mux = self._schedules.get(key)
+        if mux is None:
+            mux = self._schedules[key] = _MultiplexedHandler()
+            self.observer.schedule(mux, key[0], recursive=True)
+        mux.targets.append(handler)
         self.handlers.append(handler)
 
-        logger.info(f"Watching {config.dir} for '{config.trigger}' (debounce: {config.debounce_ms}ms)")
+        logger.info("Watching %s for '%s' (debounce: %sms)", config.dir, config.trigger, config.debounce_ms)
 
     def start(self) -> None:
         """Start all file watchers."""
@@ -165,7 +282,7 @@ class FileWatcherManager:
             return
 
         self.observer.start()
-        logger.info(f"Started {len(self.handlers)} file watcher(s)")
+        logger.info("Started %d file watcher(s)", len(self.handlers))
 
     def stop(self) -> None:
         """Stop all file watchers."""
@@ -174,7 +291,8 @@ class FileWatcherManager:
             self.observer.join(timeout=2.0)
             logger.info("Stopped file watchers")
 
-        # Cancel pending timers
+        # Cancel pending debounce tasks
         for handler in self.handlers:
-            if handler._timer:
-                handler._timer.cancel()
+            task = handler._task
+            if task is not None and not task.done():
+                task.cancel()
@@ -11,8 +11,18 @@ except ImportError:
     RunState = None
     CommandConfig = None
 
-
-@dataclass
+__all__ = [
+    "TriggerSource",
+    "PresentationUpdate",
+    "CommandNode",
+    "ConfigValidationResult",
+    "KeyboardConfig",
+    "VALID_KEYS",
+    "map_run_state_to_icon",
+]
+
+
+@dataclass(slots=True)
 class TriggerSource:
     """Represents the trigger chain that caused a command to run."""
 
@@ -40,10 +50,11 @@ class TriggerSource:
 
         last_trigger = trigger_chain[-1]
 
-        # Determine kind from last trigger
+        # Determine kind from last trigger. Two C-level substring scans
+        # cover both casings without allocating a lowercased copy.
         if last_trigger.startswith("command_"):
             kind = "lifecycle"
-        elif "file" in last_trigger.lower():
+        elif "file" in last_trigger or "File" in last_trigger:
             kind = "file"
         else:
             kind = "manual"
@@ -65,20 +76,35 @@ class TriggerSource:
         if not self.chain:
             return "manual"
 
-        full_chain = separator.join(self.chain)
+        sep_len = len(separator)
+        total = sum(len(item) for item in self.chain) + sep_len * (len(self.chain) - 1)
 
         # FIX #7: Minimum width check before truncation
-        if max_width < 10:
-            # Too narrow to truncate meaningfully, return as-is
-            return full_chain
-
-        # Truncate from left if needed
-        if len(full_chain) > max_width:
-            keep_chars = max_width - 4  # Reserve 4 for "... "
-            if keep_chars > 0:
-                return f"...{separator}{full_chain[-keep_chars:]}"
-
-        return full_chain
+        # (too narrow to truncate meaningfully, return as-is)
+        if max_width < 10 or total <= max_width:
+            return separator.join(self.chain)
+
+        # Truncate from left. Join only the tail elements that can survive
+        # the cut rather than materializing the full chain first.
+        keep_chars = max_width - 4  # Reserve 4 for "... "
+        if keep_chars <= 0:
+            return separator.join(self.chain)
+
+        tail: list[str] = []
+        tail_len = -sep_len
+        for item in reversed(self.chain):
+            tail.append(item)
+            tail_len += len(item) + sep_len
+            if tail_len >= keep_chars:
+                break
+
+        tail.reverse()
+        suffix = separator.join(tail)
+        if len(tail) < len(self.chain):
+            # The slice may start mid-separator; include the one that
+            # precedes the kept tail in the full join
+            suffix = separator + suffix
+        return f"...{separator}{suffix[-keep_chars:]}"
 
     def get_semantic_summary(self) -> str:
         """Get human-readable summary of trigger source.
@@ -100,7 +126,7 @@ class TriggerSource:
             return "Ran automatically"
 
 
-@dataclass
+@dataclass(slots=True)
 class PresentationUpdate:
     """Update to be applied to a widget display."""
 
@@ -117,28 +143,52 @@ class PresentationUpdate:
     """Path to output file (if available)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandNode:
     """Hierarchical node representing a command and its children."""
 
     config: CommandConfig
     """Command configuration from cmdorc."""
 
-    children: list["CommandNode"] = field(default_factory=list)
-    """Child commands (those triggered by this command's success/failure/cancellation)."""
+    children: "list[CommandNode] | tuple[CommandNode, ...]" = field(default_factory=list)
+    """Child commands (those triggered by this command's success/failure/cancellation).
+
+    Mutable list during hierarchy construction; load_frontend_config freezes
+    it to a tuple once the tree is final.
+    """
+
+    _preorder: "tuple[CommandNode, ...] | None" = field(default=None, repr=False, compare=False)
+    """Cached preorder traversal - populated once the hierarchy is final."""
 
     @property
     def name(self) -> str:
         """Get command name from config."""
         return self.config.name
 
+    def iter_preorder(self) -> "tuple[CommandNode, ...]":
+        """Get this subtree flattened in preorder (cached after first call).
+
+        The hierarchy is immutable once built by load_frontend_config, so
+        repeated UI walks iterate the cached tuple instead of re-walking
+        the tree node by node.
+        """
+        if self._preorder is None:
+            order: list[CommandNode] = []
+            stack: list[CommandNode] = [self]
+            while stack:
+                node = stack.pop()
+                order.append(node)
+                stack.extend(reversed(node.children))
+            self._preorder = tuple(order)
+        return self._preorder
+
     @property
     def triggers(self) -> list[str]:
         """Get triggers from config."""
         return self.config.triggers
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigValidationResult:
     """Results from startup configuration validation.
 
@@ -158,7 +208,7 @@ class ConfigValidationResult:
     """Config errors (should be fatal)."""
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyboardConfig:
     """Keyboard shortcut configuration.
 
@@ -175,14 +225,27 @@ class KeyboardConfig:
     """Whether to show keyboard hints in tooltips."""
 
 
-# FIX #8: Valid keyboard keys
-VALID_KEYS = set(
-    [str(i) for i in range(1, 10)]  # 1-9
-    + [chr(i) for i in range(ord("a"), ord("z") + 1)]  # a-z
-    + [f"f{i}" for i in range(1, 13)]  # f1-f12
+# FIX #8: Valid keyboard keys (frozen - membership tests are O(1) hashed).
+# Built from literals so no comprehensions run at import time.
+VALID_KEYS: frozenset[str] = (
+    frozenset("123456789")
+    | frozenset("abcdefghijklmnopqrstuvwxyz")
+    | frozenset({"f1", "f2", "f3", "f4", "f5", "f6", "f7", "f8", "f9", "f10", "f11", "f12"})
 )
 
 
+# State→icon table built once; lookup is a single hash probe per call
+if RunState is not None:
+    _STATE_ICONS = {
+        RunState.SUCCESS: "✅",
+        RunState.FAILED: "❌",
+        RunState.CANCELLED: "⏹",
+        RunState.RUNNING: "⏳",
+    }
+else:
+    _STATE_ICONS = {}
+
+
 def map_run_state_to_icon(state: "RunState") -> str:
     """Map cmdorc.RunState enum to UI icons.
 
@@ -192,16 +255,4 @@ def map_run_state_to_icon(state: "RunState") -> str:
     Returns:
         Unicode icon string representing the state.
     """
-    if RunState is None:
-        return "❓"
-
-    if state == RunState.SUCCESS:
-        return "✅"
-    elif state == RunState.FAILED:
-        return "❌"
-    elif state == RunState.CANCELLED:
-        return "⏹"
-    elif state == RunState.RUNNING:
-        return "⏳"
-    else:
-        return "❓"  # PENDING or unknown state
+    return _STATE_ICONS.get(state, "❓")  # ❓ for PENDING or unknown state
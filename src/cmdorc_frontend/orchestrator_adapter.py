@@ -13,23 +13,21 @@ without depending on Textual or any UI framework.
 
 import asyncio
 import logging
-from collections.abc import Callable
+import threading
+from collections import defaultdict
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
-from cmdorc import CommandOrchestrator, RunHandle, load_config
+from cmdorc import CommandOrchestrator, RunHandle
 
 from cmdorc_frontend.config import load_frontend_config
 
-logger = logging.getLogger(__name__)
-
-# Optional: Only import if watchdog is available
-try:
+if TYPE_CHECKING:
     from cmdorc_frontend.file_watcher import FileWatcherManager
 
-    _WATCHDOG_AVAILABLE = True
-except ImportError:
-    _WATCHDOG_AVAILABLE = False
-    logger.debug("watchdog not available - file watching disabled")
+logger = logging.getLogger(__name__)
 
 
 class OrchestratorAdapter:
@@ -55,6 +53,27 @@ class OrchestratorAdapter:
         adapter.detach()
     """
 
+    # Fixed attribute set - slots drop the per-instance __dict__ and give
+    # slightly faster attribute access for hosts that spin up many adapters
+    __slots__ = (
+        "config_path",
+        "_loop",
+        "_loop_thread_id",
+        "_enable_watchers",
+        "keyboard_config",
+        "_watchers",
+        "_hierarchy",
+        "orchestrator",
+        "_shortcuts_view",
+        "_command_names",
+        "_is_attached",
+        "_watcher_manager",
+        "_wired",
+        "_command_success_callbacks",
+        "_command_failed_callbacks",
+        "_command_cancelled_callbacks",
+    )
+
     def __init__(self, config_path: str | Path, enable_watchers: bool = True):
         """Initialize adapter with configuration.
 
@@ -64,21 +83,52 @@ class OrchestratorAdapter:
         """
         self.config_path = Path(config_path)
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
         self._enable_watchers = enable_watchers
 
-        # Load configuration
-        runner_config = load_config(self.config_path)
+        # Load configuration - load_frontend_config already runs cmdorc's
+        # loader, so reuse its runner_config instead of parsing twice
+        runner_config, self.keyboard_config, self._watchers, self._hierarchy = load_frontend_config(self.config_path)
         self.orchestrator = CommandOrchestrator(runner_config)
 
-        # Load frontend configuration
-        _, self.keyboard_config, self._watchers, self._hierarchy = load_frontend_config(self.config_path)
+        # Shortcuts never change after load - hand out one read-only view
+        # instead of copying the dict for every caller
+        self._shortcuts_view: Mapping[str, str] = MappingProxyType(self.keyboard_config.shortcuts or {})
+
+        # Command list is fixed after config load - query the orchestrator once
+        self._command_names: tuple[str, ...] = tuple(self.orchestrator.list_commands())
 
         # Track state
         self._is_attached = False
         self._watcher_manager: FileWatcherManager | None = None
-        self._command_success_callbacks: dict[str, list[Callable]] = {}
-        self._command_failed_callbacks: dict[str, list[Callable]] = {}
-        self._command_cancelled_callbacks: dict[str, list[Callable]] = {}
+        self._wired: set[str] = set()
+        # Callbacks are stored as (callback, is_coroutine) pairs so dispatch
+        # never pays for iscoroutinefunction introspection per event
+        self._command_success_callbacks: defaultdict[str, list[tuple[Callable, bool]]] = defaultdict(list)
+        self._command_failed_callbacks: defaultdict[str, list[tuple[Callable, bool]]] = defaultdict(list)
+        self._command_cancelled_callbacks: defaultdict[str, list[tuple[Callable, bool]]] = defaultdict(list)
+
+    @staticmethod
+    def install_uvloop() -> bool:
+        """Install uvloop's event loop policy if available (opt-in).
+
+        uvloop cuts per-callback and selector-wakeup latency substantially,
+        which matters for file-watcher-driven bursts. Must be called before
+        the event loop is created (i.e. before app.run()/asyncio.run()).
+        No-op when uvloop is not installed.
+
+        Returns:
+            True if uvloop was installed, False otherwise
+        """
+        try:
+            import uvloop
+        except ImportError:
+            logger.debug("uvloop not available - using default event loop")
+            return False
+
+        uvloop.install()
+        logger.debug("uvloop event loop policy installed")
+        return True
 
     def attach(self, loop: asyncio.AbstractEventLoop) -> None:
         """Attach adapter to an event loop.
@@ -100,22 +150,31 @@ class OrchestratorAdapter:
             raise RuntimeError("Event loop must be running to attach")
 
         self._loop = loop
+        # attach() runs on the loop thread; remember it so request_run/
+        # request_cancel can skip the self-pipe wakeup when called from it
+        self._loop_thread_id = threading.get_ident()
         self._is_attached = True
 
         # Wire all registered lifecycle callbacks
-        for cmd_name in self.orchestrator.list_commands():
+        for cmd_name in self._command_names:
             self._wire_lifecycle_callbacks(cmd_name)
 
-        # Start file watchers if enabled
-        if self._enable_watchers and self._watchers and _WATCHDOG_AVAILABLE:
+        # Start file watchers if enabled. Imported here so watchdog is only
+        # loaded by adapters that actually configure watchers.
+        if self._enable_watchers and self._watchers:
             try:
-                self._watcher_manager = FileWatcherManager(self.orchestrator, loop)
-                for watcher_config in self._watchers:
-                    self._watcher_manager.add_watch(watcher_config)
-                self._watcher_manager.start()
-            except Exception as e:
-                logger.error(f"Failed to start file watchers: {e}")
-                self._watcher_manager = None
+                from cmdorc_frontend.file_watcher import FileWatcherManager
+            except ImportError:
+                logger.debug("watchdog not available - file watching disabled")
+            else:
+                try:
+                    self._watcher_manager = FileWatcherManager(self.orchestrator, loop)
+                    for watcher_config in self._watchers:
+                        self._watcher_manager.add_watch(watcher_config)
+                    self._watcher_manager.start()
+                except Exception as e:
+                    logger.error("Failed to start file watchers: %s", e)
+                    self._watcher_manager = None
 
         logger.debug("Adapter attached to event loop")
 
@@ -129,18 +188,21 @@ class OrchestratorAdapter:
             try:
                 self._watcher_manager.stop()
             except Exception as e:
-                logger.error(f"Failed to stop file watchers: {e}")
+                logger.error("Failed to stop file watchers: %s", e)
             self._watcher_manager = None
 
         self._is_attached = False
         self._loop = None
+        self._loop_thread_id = None
+        self._wired.clear()
         logger.debug("Adapter detached from event loop")
 
     def _wire_lifecycle_callbacks(self, command_name: str) -> None:
-        """Wire all registered callbacks for a command to orchestrator.
+        """Wire dispatch handlers for a command to orchestrator (once).
 
-        Maps callback registrations to orchestrator.set_lifecycle_callback()
-        with correct parameter names:
+        The handlers dispatch to the registration lists, so later
+        registrations are picked up without re-wiring. Maps to
+        orchestrator.set_lifecycle_callback() with correct parameter names:
         - on_success (not on_started)
         - on_failed
         - on_cancelled
@@ -148,6 +210,10 @@ class OrchestratorAdapter:
         Args:
             command_name: Command to wire callbacks for
         """
+        if command_name in self._wired:
+            return
+        self._wired.add(command_name)
+
         on_success = self._make_callback_handler(command_name, "success")
         on_failed = self._make_callback_handler(command_name, "failed")
         on_cancelled = self._make_callback_handler(command_name, "cancelled")
@@ -170,25 +236,32 @@ class OrchestratorAdapter:
         Returns:
             Callable that takes (handle, context) and dispatches to listeners
         """
+        registry = {
+            "success": self._command_success_callbacks,
+            "failed": self._command_failed_callbacks,
+            "cancelled": self._command_cancelled_callbacks,
+        }[status]
+        # Bind the live list once at wiring time - registrations append to
+        # this same list, so dispatch sees them with zero per-event lookups
+        callbacks = registry[command_name]
 
         def handler(handle: RunHandle | None, context=None):
-            callbacks_map = {
-                "success": self._command_success_callbacks,
-                "failed": self._command_failed_callbacks,
-                "cancelled": self._command_cancelled_callbacks,
-            }
-
-            callbacks = callbacks_map.get(status, {})
-            for callback in callbacks.get(command_name, []):
+            # Iterate the bound list reference directly - no defensive copy.
+            # List iteration is index-based, so callbacks registered during
+            # dispatch are appended behind the cursor and simply fire too;
+            # nothing is skipped or double-fired.
+            for callback, is_coro in callbacks:
                 try:
-                    if asyncio.iscoroutinefunction(callback):
+                    if is_coro:
                         # Schedule async callback on the event loop
                         if self._loop and self._loop.is_running():
-                            asyncio.create_task(callback(handle))
+                            # loop.create_task skips asyncio's running-loop
+                            # lookup on every dispatch
+                            self._loop.create_task(callback(handle))
                     else:
                         callback(handle)
                 except Exception as e:
-                    logger.exception(f"Error in {status} callback for '{command_name}': {e}")
+                    logger.exception("Error in %s callback for '%s': %s", status, command_name, e)
 
         return handler
 
@@ -233,9 +306,16 @@ class OrchestratorAdapter:
             try:
                 await self.run_command(name)
             except Exception as e:
-                logger.error(f"Failed to run command '{name}': {e}")
+                logger.error("Failed to run command '%s': %s", name, e)
 
-        self._loop.call_soon_threadsafe(lambda: asyncio.create_task(run()))
+        if threading.get_ident() == self._loop_thread_id:
+            # Already on the loop thread (the common UI-callback case) -
+            # skip call_soon_threadsafe's self-pipe wakeup syscall
+            self._loop.create_task(run())
+        else:
+            # Schedules the coroutine in one loop wakeup instead of hopping
+            # through a callback that only exists to create the task
+            asyncio.run_coroutine_threadsafe(run(), self._loop)
 
     async def cancel_command(self, name: str) -> int:
         """Cancel all active runs of a command.
@@ -267,9 +347,12 @@ class OrchestratorAdapter:
             try:
                 await self.cancel_command(name)
             except Exception as e:
-                logger.error(f"Failed to cancel command '{name}': {e}")
+                logger.error("Failed to cancel command '%s': %s", name, e)
 
-        self._loop.call_soon_threadsafe(lambda: asyncio.create_task(cancel()))
+        if threading.get_ident() == self._loop_thread_id:
+            self._loop.create_task(cancel())
+        else:
+            asyncio.run_coroutine_threadsafe(cancel(), self._loop)
 
     # ========================================================================
     # Callback Registration
@@ -282,11 +365,9 @@ class OrchestratorAdapter:
             name: Command name
             callback: Callable(handle) - may be async
         """
-        if name not in self._command_success_callbacks:
-            self._command_success_callbacks[name] = []
-        self._command_success_callbacks[name].append(callback)
+        self._command_success_callbacks[name].append((callback, asyncio.iscoroutinefunction(callback)))
 
-        # Re-wire if already attached
+        # Wire dispatch handlers if attached and not wired yet
         if self._is_attached:
             self._wire_lifecycle_callbacks(name)
 
@@ -297,11 +378,9 @@ class OrchestratorAdapter:
             name: Command name
             callback: Callable(handle) - may be async
         """
-        if name not in self._command_failed_callbacks:
-            self._command_failed_callbacks[name] = []
-        self._command_failed_callbacks[name].append(callback)
+        self._command_failed_callbacks[name].append((callback, asyncio.iscoroutinefunction(callback)))
 
-        # Re-wire if already attached
+        # Wire dispatch handlers if attached and not wired yet
         if self._is_attached:
             self._wire_lifecycle_callbacks(name)
 
@@ -312,11 +391,9 @@ class OrchestratorAdapter:
             name: Command name
             callback: Callable(handle) - may be async
         """
-        if name not in self._command_cancelled_callbacks:
-            self._command_cancelled_callbacks[name] = []
-        self._command_cancelled_callbacks[name].append(callback)
+        self._command_cancelled_callbacks[name].append((callback, asyncio.iscoroutinefunction(callback)))
 
-        # Re-wire if already attached
+        # Wire dispatch handlers if attached and not wired yet
         if self._is_attached:
             self._wire_lifecycle_callbacks(name)
 
@@ -324,13 +401,13 @@ class OrchestratorAdapter:
     # Queries
     # ========================================================================
 
-    def get_keyboard_shortcuts(self) -> dict[str, str]:
+    def get_keyboard_shortcuts(self) -> Mapping[str, str]:
         """Get keyboard shortcut mapping.
 
         Returns:
-            Dict mapping command_name -> shortcut key
+            Read-only mapping of command_name -> shortcut key
         """
-        return self.keyboard_config.shortcuts.copy() if self.keyboard_config.shortcuts else {}
+        return self._shortcuts_view
 
     def get_command_names(self) -> list[str]:
         """Get all registered command names in TOML order.
@@ -338,4 +415,4 @@ class OrchestratorAdapter:
         Returns:
             List of command names in the order they appear in config
         """
-        return self.orchestrator.list_commands()
+        return list(self._command_names)
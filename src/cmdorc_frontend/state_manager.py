@@ -1,9 +1,12 @@
 """State reconciliation logic - UI-agnostic command state synchronization."""
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Protocol
 
+from cmdorc_frontend.models import map_run_state_to_icon
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +45,8 @@ class StateReconciler:
     or history. Idempotent and read-only - never triggers execution.
     """
 
+    __slots__ = ("orchestrator",)
+
     def __init__(self, orchestrator):
         """Initialize reconciler with orchestrator.
 
@@ -65,28 +70,47 @@ class StateReconciler:
             active_handles = self.orchestrator.get_active_handles(view.command_name)
 
             if active_handles:
-                # Command is running
+                # Command is running. EAFP: attributes exist on real cmdorc
+                # objects, so try/except beats hasattr's double lookup.
                 handle = active_handles[-1]  # Latest handle
-                if hasattr(handle, "is_finalized") and handle.is_finalized:
+                try:
+                    is_finalized = handle.is_finalized
+                except AttributeError:
+                    is_finalized = False
+
+                if is_finalized:
                     # Handle is finalized (completed)
                     self._update_from_result(view, handle)
                 else:
                     # Handle is still running
-                    comment = getattr(handle, "comment", "Running")
+                    try:
+                        comment = handle.comment
+                    except AttributeError:
+                        comment = "Running"
                     view.set_running(True, f"Running: {comment}")
             else:
                 # Check history for last result
                 history = self.orchestrator.get_history(view.command_name, limit=1)
                 if history:
                     result = history[0]
-                    icon = self._map_state_icon(result.state)
-                    duration = getattr(result, "duration_str", "?")
-                    tooltip = f"{result.state.value} ({duration})"
-                    output_path = getattr(result, "output", None)
-                    view.set_result(icon, tooltip, output_path)
+                    view.set_result(*self._result_display(result))
                 # else: no history, leave at default idle state
         except Exception as e:
-            logger.error(f"Error reconciling state for {view.command_name}: {e}")
+            logger.error("Error reconciling state for %s: %s", view.command_name, e)
+
+    def reconcile_all(self, views: Iterable[CommandView]) -> None:
+        """Sync many views with orchestrator state in one pass.
+
+        Startup and reload call this once instead of invoking reconcile()
+        per widget from scattered call sites. Per-view failures stay
+        isolated by reconcile()'s own error handling.
+
+        Args:
+            views: CommandViews to update
+        """
+        reconcile = self.reconcile
+        for view in views:
+            reconcile(view)
 
     def _update_from_result(self, view: CommandView, handle) -> None:
         """Update view from completed RunHandle.
@@ -95,13 +119,26 @@ class StateReconciler:
             view: CommandView to update
             handle: RunHandle with result
         """
-        result = getattr(handle, "_result", None)
+        try:
+            result = handle._result
+        except AttributeError:
+            return
         if result:
-            icon = self._map_state_icon(result.state)
-            duration = getattr(result, "duration_str", "?")
-            tooltip = f"{result.state.value} ({duration})"
-            output_path = getattr(result, "output", None)
-            view.set_result(icon, tooltip, output_path)
+            view.set_result(*self._result_display(result))
+
+    def _result_display(self, result) -> tuple[str, str, Path | None]:
+        """Build (icon, tooltip, output_path) for a RunResult."""
+        icon = self._map_state_icon(result.state)
+        try:
+            duration = result.duration_str
+        except AttributeError:
+            duration = "?"
+        tooltip = f"{result.state.value} ({duration})"
+        try:
+            output_path = result.output
+        except AttributeError:
+            output_path = None
+        return icon, tooltip, output_path
 
     def _map_state_icon(self, state) -> str:
         """Map cmdorc RunState to icon string.
@@ -112,6 +149,4 @@ class StateReconciler:
         Returns:
             Icon string
         """
-        from cmdorc_frontend.models import map_run_state_to_icon
-
         return map_run_state_to_icon(state)
@@ -5,20 +5,20 @@ from pathlib import Path
 from typing import Protocol
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WatcherConfig:
-    """Configuration for a file watcher."""
+    """Configuration for a file watcher (immutable value object)."""
 
     dir: Path
     """Directory to watch."""
 
-    patterns: list[str] | None = None
+    patterns: tuple[str, ...] | None = None
     """Include patterns (glob style)."""
 
-    extensions: list[str] | None = None
+    extensions: tuple[str, ...] | None = None
     """Include extensions (fallback if patterns not specified)."""
 
-    ignore_dirs: list[str] | None = None
+    ignore_dirs: tuple[str, ...] | None = None
     """Directories to ignore."""
 
     trigger: str = ""
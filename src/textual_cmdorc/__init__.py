@@ -2,9 +2,9 @@
 
 __version__ = "0.1.0"
 
-# Public API
+# Public API - the adapter is lightweight and always wanted; the app class
+# drags in Textual and the full widget stack, so it loads lazily (PEP 562)
 from cmdorc_frontend.orchestrator_adapter import OrchestratorAdapter
-from textual_cmdorc.cmdorc_app import CmdorcApp
 
 __all__ = [
     "__version__",
@@ -12,3 +12,13 @@ __all__ = [
     "CmdorcApp",
     "OrchestratorAdapter",
 ]
+
+
+def __getattr__(name: str):
+    """Lazily import the TUI app on first access."""
+    if name == "CmdorcApp":
+        from textual_cmdorc.cmdorc_app import CmdorcApp
+
+        globals()[name] = CmdorcApp
+        return CmdorcApp
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
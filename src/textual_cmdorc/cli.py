@@ -5,6 +5,7 @@ import logging
 import sys
 from pathlib import Path
 
+from cmdorc_frontend.orchestrator_adapter import OrchestratorAdapter
 from textual_cmdorc import __version__
 from textual_cmdorc.cmdorc_app import CmdorcApp
 
@@ -47,6 +48,9 @@ enabled = true
 show_in_tooltips = true
 """
 
+# Encoded once at import so first-run writes skip per-call UTF-8 encoding
+_DEFAULT_CONFIG_BYTES = DEFAULT_CONFIG_TEMPLATE.encode("utf-8")
+
 
 def create_default_config(config_path: Path) -> bool:
     """
@@ -65,11 +69,13 @@ def create_default_config(config_path: Path) -> bool:
     if config_path.exists():
         return False
 
-    # Ensure parent directory exists
-    config_path.parent.mkdir(parents=True, exist_ok=True)
+    # Ensure parent directory exists (skip the mkdir syscalls when it does)
+    parent = config_path.parent
+    if not parent.is_dir():
+        parent.mkdir(parents=True, exist_ok=True)
 
-    # Write template to config file
-    config_path.write_text(DEFAULT_CONFIG_TEMPLATE)
+    # Write pre-encoded template to config file
+    config_path.write_bytes(_DEFAULT_CONFIG_BYTES)
     return True
 
 
@@ -131,7 +137,8 @@ def main() -> None:
             print(f"Error: Config file not found: {config_path}", file=sys.stderr)
             sys.exit(1)
 
-        # Launch the app
+        # Launch the app (uvloop installed before the loop exists, if present)
+        OrchestratorAdapter.install_uvloop()
         app = CmdorcApp(config_path=str(config_path))
         app.run()
 
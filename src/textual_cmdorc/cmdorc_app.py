@@ -11,13 +11,13 @@ Enhanced with rich tooltips showing:
 
 import asyncio
 import logging
+import re
+from functools import lru_cache, partial
 from pathlib import Path
 
 from cmdorc import RunHandle
 from textual.app import App, ComposeResult
 from textual.binding import Binding
-from textual.containers import Vertical
-from textual.screen import ModalScreen
 from textual.widgets import Footer, Header, Static
 from textual_filelink import CommandLink, FileLinkList, sanitize_id
 
@@ -28,41 +28,13 @@ from .tooltip_builders import TooltipBuilder
 # Logger for warnings and errors
 logger = logging.getLogger(__name__)
 
+# Command names are a small fixed set per config, so their sanitized widget
+# ids are memoized instead of re-derived on every fallback lookup
+_sanitize_id_cached = lru_cache(maxsize=None)(sanitize_id)
 
-class HelpScreen(ModalScreen):
-    """Modal help screen showing keyboard shortcuts."""
-
-    BINDINGS = [("escape", "dismiss", "Close")]
-
-    def __init__(self, shortcuts: dict[str, str], **kwargs):
-        """Initialize help screen.
-
-        Args:
-            shortcuts: Dict mapping command_name -> key
-        """
-        super().__init__(**kwargs)
-        self.shortcuts = shortcuts
-
-    def compose(self) -> ComposeResult:
-        """Compose help content."""
-        with Vertical():
-            yield Static("# Keyboard Shortcuts", classes="help-header")
-            yield Static("")
-
-            # Command shortcuts
-            if self.shortcuts:
-                yield Static("## Command Shortcuts")
-                for cmd_name, key in sorted(self.shortcuts.items()):
-                    yield Static(f"  [{key}] - Run/Stop {cmd_name}")
-                yield Static("")
-
-            # App shortcuts
-            yield Static("## App Shortcuts")
-            yield Static("  [h] - Show this help")
-            yield Static("  [r] - Reload configuration")
-            yield Static("  [q] - Quit application")
-            yield Static("")
-            yield Static("Press ESC to close", classes="help-footer")
+# Bindable shortcut keys: single lowercase letters/digits or f-keys,
+# compiled once instead of method chains per key
+_VALID_KEY_RE = re.compile(r"^[a-z0-9]$|^f[0-9]{1,2}$")
 
 
 class CmdorcApp(App):
@@ -85,43 +57,9 @@ class CmdorcApp(App):
         Binding("q", "quit", "Quit"),
     ]
 
-    CSS = """
-    Screen {
-        layout: vertical;
-    }
-
-    FileLinkList {
-        height: 1fr;
-        border: solid $accent;
-    }
-
-    CommandLink {
-        width: 100%;
-        margin: 0 0 1 0;
-    }
-
-    HelpScreen {
-        align: center middle;
-    }
-
-    HelpScreen > Vertical {
-        width: 60;
-        height: auto;
-        background: $panel;
-        border: solid $accent;
-        padding: 2;
-    }
-
-    .help-header {
-        text-style: bold;
-        color: $accent;
-    }
-
-    .help-footer {
-        text-style: italic;
-        color: $text-muted;
-    }
-    """
+    # Styles live in an external stylesheet - Textual parses the file once
+    # and the large CSS literal stays out of the module body
+    CSS_PATH = "cmdorc_app.tcss"
 
     def __init__(self, config_path: str = "config.toml", **kwargs):
         """Initialize app.
@@ -138,6 +76,24 @@ class CmdorcApp(App):
         # Track running commands for state management
         self.running_commands: set[str] = set()
 
+        # Event loop captured once at mount; reload re-attaches to the same
+        # loop, so there is no need to re-query asyncio for it
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Help text cache, built on first open and dropped on reload
+        self._help_text: str | None = None
+
+        # Links by command name - lifecycle updates hit this dict instead
+        # of a DOM query per event
+        self._links: dict[str, CommandLink] = {}
+
+        # Command names for the active config, captured once per (re)load
+        self._cmd_names: list[str] = []
+
+        # Last (icon, tooltips) written per link - identical completion
+        # updates are skipped so the widget isn't refreshed for no change
+        self._link_state: dict[str, tuple] = {}
+
     def compose(self) -> ComposeResult:
         """Compose app layout."""
         yield Header()
@@ -160,7 +116,7 @@ class CmdorcApp(App):
 
         except Exception as e:
             # Fatal config error
-            logger.error(f"Failed to initialize app: {e}")
+            logger.error("Failed to initialize app: %s", e)
             yield Static(f"❌ Configuration Error: {e}")
 
         yield Footer()
@@ -172,96 +128,48 @@ class CmdorcApp(App):
             return
 
         try:
-            # Attach to event loop
-            loop = asyncio.get_running_loop()
-            self.adapter.attach(loop)
-
-            # Populate the list (after it's mounted)
-            if self.file_list is not None:
-                cmd_names = self.adapter.get_command_names()
-
+            # Attach to event loop (cached for reload)
+            self._loop = asyncio.get_running_loop()
+            self.adapter.attach(self._loop)
+
+            # Populate the list and wire callbacks in one pass over the
+            # command names (queried from the adapter exactly once)
+            self._cmd_names = cmd_names = self.adapter.get_command_names()
+            # batch_update holds screen updates so N add_item calls cost one
+            # repaint instead of one per link (FileLinkList has no bulk API)
+            with self.batch_update():
                 for cmd_name in cmd_names:
-                    try:
-                        # Check if there's a historical run with output file
-                        status = self.adapter.orchestrator.get_status(cmd_name)
-                        initial_output_path = None
-                        if status and status.last_run and status.last_run.output_file:
-                            initial_output_path = status.last_run.output_file
-
-                        link = CommandLink(
-                            command_name=cmd_name,
-                            output_path=initial_output_path,
-                            initial_status_icon="◯",
-                            initial_status_tooltip=self.tooltip_builder.build_status_tooltip_idle(cmd_name),
-                            show_settings=True,
-                            tooltip=self.tooltip_builder.build_output_tooltip(cmd_name),
-                        )
-                        # Set play/stop button tooltips
-                        link.set_play_stop_tooltips(
-                            run_tooltip=self.tooltip_builder.build_play_tooltip(cmd_name),
-                            stop_tooltip=self.tooltip_builder.build_stop_tooltip(cmd_name, None),
-                            append_shortcuts=False,
-                        )
-                        self.file_list.add_item(link)
-                    except Exception as e:
-                        # Config error - show warning icon
-                        logger.error(f"Failed to create link for {cmd_name}: {e}")
-                        link = CommandLink(
-                            command_name=f"⚠️ {cmd_name}",
-                            output_path=None,
-                            initial_status_icon="⚠️",
-                            initial_status_tooltip=f"Config error: {e}",
-                            show_settings=False,
-                            tooltip=f"Error: {e}",
-                        )
+                    if self.file_list is not None:
+                        link = self._build_command_link(cmd_name)
                         self.file_list.add_item(link)
-
-            # Wire lifecycle callbacks for all commands
-            for cmd_name in self.adapter.get_command_names():
-                # Started event (via orchestrator.on_event)
-                logger.debug(f"Wiring command_started:{cmd_name} callback")
-                self.adapter.orchestrator.on_event(
-                    f"command_started:{cmd_name}",
-                    lambda h, ctx, name=cmd_name: self._on_command_started(name, h),
-                )
-                # Completion events (via adapter lifecycle callbacks)
-                self.adapter.on_command_success(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_success(name, h),
-                )
-                self.adapter.on_command_failed(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_failed(name, h),
-                )
-                self.adapter.on_command_cancelled(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_cancelled(name, h),
-                )
+                        self._links[cmd_name] = link
+                    self._wire_callbacks(cmd_name)
 
             # Bind global keyboard shortcuts
             self._bind_keyboard_shortcuts()
 
         except Exception as e:
-            logger.error(f"Failed to mount app: {e}", exc_info=True)
+            logger.error("Failed to mount app: %s", e, exc_info=True)
             self.exit(message=f"Error: {e}")
 
     async def on_unmount(self) -> None:
         """Cleanup on exit."""
         if self.adapter:
             self.adapter.detach()
+        self._cmd_names.clear()
 
     def _bind_keyboard_shortcuts(self) -> None:
         """Bind global keyboard shortcuts from config."""
         if not self.adapter or not self.adapter.keyboard_config.enabled:
             return
 
+        # Partition up front with the compiled pattern; the bind loop then
+        # runs over known-good pairs only (Textual exposes no bulk-bind API)
         shortcuts = self.adapter.keyboard_config.shortcuts
-        for cmd_name, key in shortcuts.items():
-            # Validate key is alphanumeric or f-key
-            if not (key.isalnum() or key.startswith("f")):
-                logger.warning(f"Invalid keyboard shortcut: {key} for {cmd_name}")
-                continue
+        match = _VALID_KEY_RE.match
+        valid = [(cmd_name, key) for cmd_name, key in shortcuts.items() if match(key)]
 
+        for cmd_name, key in valid:
             # Bind key to toggle command (play if idle, stop if running)
             self.bind(
                 key,
@@ -270,6 +178,11 @@ class CmdorcApp(App):
                 show=False,
             )
 
+        # One batched warning instead of a log record per bad key
+        if len(valid) != len(shortcuts):
+            invalid = [f"{key!r} for {cmd_name}" for cmd_name, key in shortcuts.items() if not match(key)]
+            logger.warning("Ignored invalid keyboard shortcut(s): %s", ", ".join(invalid))
+
     async def action_toggle_command(self, cmd_name: str) -> None:
         """Toggle command execution (play if idle, stop if running).
 
@@ -278,21 +191,24 @@ class CmdorcApp(App):
         """
         if cmd_name in self.running_commands:
             # Stop running command
-            await self._stop_command(cmd_name)
+            self._stop_command(cmd_name)
         else:
             # Start idle command
-            await self._start_command(cmd_name)
+            self._start_command(cmd_name)
 
-    async def _start_command(self, cmd_name: str) -> None:
+    def _start_command(self, cmd_name: str) -> None:
         """Start command execution.
 
+        Sync on purpose - the body never awaits (request_run schedules the
+        actual run), so click handlers can call it without task overhead.
+
         Args:
             cmd_name: Command name
         """
         if not self.adapter:
             return
 
-        logger.info(f"Starting command: {cmd_name}")
+        logger.info("Starting command: %s", cmd_name)
         self.running_commands.add(cmd_name)
 
         # Update UI to running state (generic tooltip until handle available)
@@ -307,7 +223,7 @@ class CmdorcApp(App):
         # Request execution (async, returns immediately)
         self.adapter.request_run(cmd_name)
 
-    async def _stop_command(self, cmd_name: str) -> None:
+    def _stop_command(self, cmd_name: str) -> None:
         """Stop command execution.
 
         Args:
@@ -316,7 +232,7 @@ class CmdorcApp(App):
         if not self.adapter:
             return
 
-        logger.info(f"Stopping command: {cmd_name}")
+        logger.info("Stopping command: %s", cmd_name)
         self.running_commands.discard(cmd_name)
 
         # Update UI to stopped state
@@ -341,8 +257,8 @@ class CmdorcApp(App):
         Args:
             event: CommandLink.PlayClicked message
         """
-        logger.debug(f"Play clicked: {event.name}")
-        asyncio.create_task(self._start_command(event.name))
+        logger.debug("Play clicked: %s", event.name)
+        self._start_command(event.name)
 
     def on_command_link_stop_clicked(self, event: CommandLink.StopClicked) -> None:
         """Handle stop button clicks.
@@ -350,8 +266,8 @@ class CmdorcApp(App):
         Args:
             event: CommandLink.StopClicked message
         """
-        logger.debug(f"Stop clicked: {event.name}")
-        asyncio.create_task(self._stop_command(event.name))
+        logger.debug("Stop clicked: %s", event.name)
+        self._stop_command(event.name)
 
     def on_command_link_settings_clicked(self, event: CommandLink.SettingsClicked) -> None:
         """Handle settings icon clicks (placeholder).
@@ -359,7 +275,7 @@ class CmdorcApp(App):
         Args:
             event: CommandLink.SettingsClicked message
         """
-        logger.debug(f"Settings clicked: {event.name}")
+        logger.debug("Settings clicked: %s", event.name)
         self.notify(f"Settings for {event.name} (coming soon)")
 
     # ========================================================================
@@ -373,10 +289,13 @@ class CmdorcApp(App):
             name: Command name
             handle: RunHandle for the started run (may be None for command_started events)
         """
-        logger.debug(f"_on_command_started called for {name}, handle={handle}")
+        logger.debug("_on_command_started called for %s, handle=%s", name, handle)
 
-        logger.info(f"Command started: {name}")
+        logger.info("Command started: %s", name)
         self.running_commands.add(name)
+        # The link is about to show running state, so the next completion
+        # must write even if its content matches the previous result
+        self._link_state.pop(name, None)
 
         link = self._get_link(name)
         if link:
@@ -394,61 +313,64 @@ class CmdorcApp(App):
                 append_shortcuts=False,
             )
 
-    def _on_command_success(self, name: str, handle: RunHandle) -> None:
-        """Handle successful command completion.
+    def _on_command_completed(self, name: str, handle: RunHandle, *, icon: str) -> None:
+        """Shared completion handling for success/failed/cancelled.
 
         Args:
             name: Command name
             handle: RunHandle with result
+            icon: Status icon to display
         """
-        logger.info(f"Command succeeded: {name}")
         self.running_commands.discard(name)
 
         link = self._get_link(name)
         if link:
+            status_tooltip = self.tooltip_builder.build_status_tooltip_completed(name, handle)
+            run_tooltip = self.tooltip_builder.build_play_tooltip(name)
+            output_tooltip = self.tooltip_builder.build_output_tooltip(name)
+
+            # Skip the widget writes when nothing changed since the last
+            # completion - repeated identical events are pure render churn
+            new_state = (icon, status_tooltip, run_tooltip, output_tooltip)
+            if self._link_state.get(name) == new_state:
+                return
+            self._link_state[name] = new_state
+
             # Update tooltips
             link.set_status(
                 running=False,
-                icon="✅",
-                tooltip=self.tooltip_builder.build_status_tooltip_completed(name, handle),
-                run_tooltip=self.tooltip_builder.build_play_tooltip(name),
+                icon=icon,
+                tooltip=status_tooltip,
+                run_tooltip=run_tooltip,
                 append_shortcuts=False,
             )
 
             # Update command name tooltip with output preview
-            link.tooltip = self.tooltip_builder.build_output_tooltip(name)
+            link.tooltip = output_tooltip
 
             # Update output_path if available
             if handle.output_file:
                 link.set_output_path(handle.output_file)
 
-    def _on_command_failed(self, name: str, handle: RunHandle) -> None:
-        """Handle failed command.
+    def _on_command_success(self, name: str, handle: RunHandle) -> None:
+        """Handle successful command completion.
 
         Args:
             name: Command name
             handle: RunHandle with result
         """
-        logger.error(f"Command failed: {name}")
-        self.running_commands.discard(name)
+        logger.info("Command succeeded: %s", name)
+        self._on_command_completed(name, handle, icon="✅")
 
-        link = self._get_link(name)
-        if link:
-            # Update tooltips
-            link.set_status(
-                running=False,
-                icon="❌",
-                tooltip=self.tooltip_builder.build_status_tooltip_completed(name, handle),
-                run_tooltip=self.tooltip_builder.build_play_tooltip(name),
-                append_shortcuts=False,
-            )
-
-            # Update command name tooltip with output preview
-            link.tooltip = self.tooltip_builder.build_output_tooltip(name)
+    def _on_command_failed(self, name: str, handle: RunHandle) -> None:
+        """Handle failed command.
 
-            # Update output_path if available
-            if handle.output_file:
-                link.set_output_path(handle.output_file)
+        Args:
+            name: Command name
+            handle: RunHandle with result
+        """
+        logger.error("Command failed: %s", name)
+        self._on_command_completed(name, handle, icon="❌")
 
     def _on_command_cancelled(self, name: str, handle: RunHandle) -> None:
         """Handle cancelled command.
@@ -457,26 +379,8 @@ class CmdorcApp(App):
             name: Command name
             handle: RunHandle with result
         """
-        logger.info(f"Command cancelled: {name}")
-        self.running_commands.discard(name)
-
-        link = self._get_link(name)
-        if link:
-            # Update tooltips
-            link.set_status(
-                running=False,
-                icon="⚠️",
-                tooltip=self.tooltip_builder.build_status_tooltip_completed(name, handle),
-                run_tooltip=self.tooltip_builder.build_play_tooltip(name),
-                append_shortcuts=False,
-            )
-
-            # Update command name tooltip with output preview
-            link.tooltip = self.tooltip_builder.build_output_tooltip(name)
-
-            # Update output_path if available
-            if handle.output_file:
-                link.set_output_path(handle.output_file)
+        logger.info("Command cancelled: %s", name)
+        self._on_command_completed(name, handle, icon="⚠️")
 
     # ========================================================================
     # App Actions
@@ -491,12 +395,12 @@ class CmdorcApp(App):
             if self.adapter:
                 self.adapter.detach()
 
-            # Clear running commands state
+            # Clear running commands state and caches tied to the old config
             self.running_commands.clear()
-
-            # Remove old command list and wait for removal to complete
-            if self.file_list:
-                await self.file_list.remove()
+            self._help_text = None
+            self._link_state.clear()
+            old_links = self._links
+            self._links = {}
 
             # Recreate adapter with new config
             self.adapter = OrchestratorAdapter(self.config_path)
@@ -504,75 +408,49 @@ class CmdorcApp(App):
             # Recreate tooltip builder
             self.tooltip_builder = TooltipBuilder(self.adapter)
 
-            # Rebuild EMPTY command list
-            self.file_list = FileLinkList(
-                show_toggles=False,
-                show_remove=False,
-                id="commands-list",
-            )
+            self._cmd_names = cmd_names = self.adapter.get_command_names()
 
-            # Mount new list FIRST
-            await self.mount(self.file_list, before=self.query_one(Footer))
-
-            # THEN populate it (after mounting)
-            for cmd_name in self.adapter.get_command_names():
-                try:
-                    # Check if there's a historical run with output file
-                    status = self.adapter.orchestrator.get_status(cmd_name)
-                    initial_output_path = None
-                    if status and status.last_run and status.last_run.output_file:
-                        initial_output_path = status.last_run.output_file
-
-                    link = CommandLink(
-                        command_name=cmd_name,
-                        output_path=initial_output_path,
-                        initial_status_icon="◯",
-                        initial_status_tooltip=self.tooltip_builder.build_status_tooltip_idle(cmd_name),
-                        show_settings=True,
-                        tooltip=self.tooltip_builder.build_output_tooltip(cmd_name),
-                    )
-                    link.set_play_stop_tooltips(
-                        run_tooltip=self.tooltip_builder.build_play_tooltip(cmd_name),
-                        stop_tooltip=self.tooltip_builder.build_stop_tooltip(cmd_name, None),
-                        append_shortcuts=False,
-                    )
-                    self.file_list.add_item(link)
-                except Exception as e:
-                    logger.error(f"Failed to create link for {cmd_name}: {e}")
-                    link = CommandLink(
-                        command_name=cmd_name,
-                        output_path=None,
-                        initial_status_icon="⚠️",
-                        initial_status_tooltip=f"Config error: {e}",
-                        show_settings=False,
-                        tooltip=f"Error: {e}",
-                    )
-                    self.file_list.add_item(link)
-
-            # Re-attach adapter
-            loop = asyncio.get_running_loop()
-            self.adapter.attach(loop)
-
-            # Re-wire callbacks
-            for cmd_name in self.adapter.get_command_names():
-                # Started event (via orchestrator.on_event)
-                self.adapter.orchestrator.on_event(
-                    f"command_started:{cmd_name}",
-                    lambda h, ctx, name=cmd_name: self._on_command_started(name, h),
-                )
-                # Completion events (via adapter lifecycle callbacks)
-                self.adapter.on_command_success(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_success(name, h),
-                )
-                self.adapter.on_command_failed(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_failed(name, h),
-                )
-                self.adapter.on_command_cancelled(
-                    cmd_name,
-                    lambda h, name=cmd_name: self._on_command_cancelled(name, h),
+            # Reuse the mounted FileLinkList - destroying and re-mounting it
+            # paid two layout passes even when nothing structural changed
+            if self.file_list is None:
+                self.file_list = FileLinkList(
+                    show_toggles=False,
+                    show_remove=False,
+                    id="commands-list",
                 )
+                await self.mount(self.file_list, before=self.query_one(Footer))
+
+            with self.batch_update():
+                if list(old_links) == cmd_names:
+                    # Common case: same commands in the same order. Keep every
+                    # link widget and just refresh state/tooltips from the new
+                    # config (command bodies may have changed).
+                    for cmd_name in cmd_names:
+                        link = old_links[cmd_name]
+                        link.set_status(
+                            running=False,
+                            icon="◯",
+                            tooltip=self.tooltip_builder.build_status_tooltip_idle(cmd_name),
+                            run_tooltip=self.tooltip_builder.build_play_tooltip(cmd_name),
+                            stop_tooltip=self.tooltip_builder.build_stop_tooltip(cmd_name, None),
+                            append_shortcuts=False,
+                        )
+                        link.tooltip = self.tooltip_builder.build_output_tooltip_initial(cmd_name)
+                        self._links[cmd_name] = link
+                        self._wire_callbacks(cmd_name)
+                else:
+                    # Command set or order changed - rebuild the items (the
+                    # list widget itself still survives) in TOML order
+                    self.file_list.clear_items()
+                    for cmd_name in cmd_names:
+                        link = self._build_command_link(cmd_name)
+                        self.file_list.add_item(link)
+                        self._links[cmd_name] = link
+                        self._wire_callbacks(cmd_name)
+
+            # Re-attach adapter - the app is still on the loop captured at
+            # mount, so reuse it
+            self.adapter.attach(self._loop or asyncio.get_running_loop())
 
             # Re-bind keyboard shortcuts
             self._bind_keyboard_shortcuts()
@@ -581,7 +459,7 @@ class CmdorcApp(App):
             logger.info("Configuration reloaded successfully")
 
         except Exception as e:
-            logger.error(f"Failed to reload config: {e}")
+            logger.error("Failed to reload config: %s", e)
             self.notify(f"Failed to reload: {e}", severity="error")
 
     def action_show_help(self) -> None:
@@ -590,8 +468,32 @@ class CmdorcApp(App):
             self.notify("Adapter not initialized", severity="warning")
             return
 
-        shortcuts = self.adapter.keyboard_config.shortcuts
-        self.push_screen(HelpScreen(shortcuts))
+        # Imported on first open - app startup never pays for the screen
+        from textual_cmdorc.help_screen import HelpScreen
+
+        if self._help_text is None:
+            self._help_text = self._build_help_text()
+        self.push_screen(HelpScreen(self._help_text))
+
+    def _build_help_text(self) -> str:
+        """Build the help screen body once per config.
+
+        Shortcuts only change on reload, so the text is cached on the app
+        and the screen just renders it instead of rebuilding every open.
+        """
+        lines = [""]
+        shortcuts = self.adapter.keyboard_config.shortcuts if self.adapter else {}
+        if shortcuts:
+            lines.append("## Command Shortcuts")
+            # Dict order is TOML order - matches the command list on screen
+            lines.extend(f"  [{key}] - Run/Stop {cmd_name}" for cmd_name, key in shortcuts.items())
+            lines.append("")
+        lines.append("## App Shortcuts")
+        lines.append("  [h] - Show this help")
+        lines.append("  [r] - Reload configuration")
+        lines.append("  [q] - Quit application")
+        lines.append("")
+        return "\n".join(lines)
 
     async def action_quit(self) -> None:
         """Quit application."""
@@ -601,6 +503,81 @@ class CmdorcApp(App):
     # Helper Methods
     # ========================================================================
 
+    def _build_command_link(self, cmd_name: str) -> CommandLink:
+        """Build a CommandLink for a command with tooltips pre-populated.
+
+        Shared by on_mount and action_reload_config; on config errors a
+        warning-icon fallback link is returned instead.
+
+        Args:
+            cmd_name: Command name
+
+        Returns:
+            CommandLink ready to add to the list
+        """
+        try:
+            # Check if there's a historical run with output file
+            status = self.adapter.orchestrator.get_status(cmd_name)
+            initial_output_path = None
+            if status and status.last_run and status.last_run.output_file:
+                initial_output_path = status.last_run.output_file
+
+            link = CommandLink(
+                command_name=cmd_name,
+                output_path=initial_output_path,
+                initial_status_icon="◯",
+                initial_status_tooltip=self.tooltip_builder.build_status_tooltip_idle(cmd_name),
+                show_settings=True,
+                tooltip=self.tooltip_builder.build_output_tooltip_initial(cmd_name),
+            )
+            # Set play/stop button tooltips
+            link.set_play_stop_tooltips(
+                run_tooltip=self.tooltip_builder.build_play_tooltip(cmd_name),
+                stop_tooltip=self.tooltip_builder.build_stop_tooltip(cmd_name, None),
+                append_shortcuts=False,
+            )
+            return link
+        except Exception as e:
+            # Config error - show warning icon
+            logger.error("Failed to create link for %s: %s", cmd_name, e)
+            return CommandLink(
+                command_name=f"⚠️ {cmd_name}",
+                output_path=None,
+                initial_status_icon="⚠️",
+                initial_status_tooltip=f"Config error: {e}",
+                show_settings=False,
+                tooltip=f"Error: {e}",
+            )
+
+    def _wire_callbacks(self, cmd_name: str) -> None:
+        """Register started/success/failed/cancelled callbacks for a command.
+
+        Args:
+            cmd_name: Command name
+        """
+        # partial over bound methods instead of four lambdas per command -
+        # no closure/cell allocations, and the registries hold real names
+        # Started event (via orchestrator.on_event)
+        logger.debug("Wiring command_started:%s callback", cmd_name)
+        self.adapter.orchestrator.on_event(
+            f"command_started:{cmd_name}",
+            partial(self._dispatch_started, cmd_name),
+        )
+        # Completion events (via adapter lifecycle callbacks)
+        self.adapter.on_command_success(cmd_name, partial(self._on_command_success, cmd_name))
+        self.adapter.on_command_failed(cmd_name, partial(self._on_command_failed, cmd_name))
+        self.adapter.on_command_cancelled(cmd_name, partial(self._on_command_cancelled, cmd_name))
+
+    def _dispatch_started(self, name: str, handle: RunHandle | None, context=None) -> None:
+        """Adapt orchestrator on_event's (handle, context) signature.
+
+        Args:
+            name: Command name (bound via partial at wiring time)
+            handle: RunHandle for the started run
+            context: Event context from the orchestrator (unused)
+        """
+        self._on_command_started(name, handle)
+
     def _get_link(self, cmd_name: str) -> CommandLink | None:
         """Get CommandLink widget by command name.
 
@@ -610,11 +587,17 @@ class CmdorcApp(App):
         Returns:
             CommandLink widget or None if not found
         """
+        link = self._links.get(cmd_name)
+        if link is not None:
+            return link
+
+        # Fallback: DOM query by sanitized id (e.g. links mounted outside
+        # the normal population paths)
         try:
-            link_id = sanitize_id(cmd_name)
+            link_id = _sanitize_id_cached(cmd_name)
             return self.query_one(f"#{link_id}", CommandLink)
         except Exception as e:
-            logger.warning(f"Failed to get link for {cmd_name}: {e}")
+            logger.warning("Failed to get link for %s: %s", cmd_name, e)
             return None
 
 
@@ -624,6 +607,8 @@ def main(config_path: str = "config.toml") -> None:
     Args:
         config_path: Path to TOML config file
     """
+    # Opt into uvloop before the loop exists; no-op when not installed
+    OrchestratorAdapter.install_uvloop()
     app = CmdorcApp(config_path=config_path)
     app.run()
 
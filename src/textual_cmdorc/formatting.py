@@ -90,6 +90,56 @@ def strip_ansi(text: str) -> str:
     return ansi_escape.sub("", text)
 
 
+# Files up to this size are read whole; larger ones take the bounded-tail
+# path so preview cost stops scaling with output size
+_TAIL_THRESHOLD = 64 * 1024
+
+
+def _read_tail(output_file: Path, max_lines: int) -> tuple[list[str], int]:
+    """Read the last max_lines lines of a large file without loading it.
+
+    Counts newlines in a forward chunked binary scan (for the total), then
+    seeks backwards in blocks until the tail buffer holds enough complete
+    lines. I/O is O(file size) but memory stays bounded, and only the tail
+    is ever decoded.
+
+    Args:
+        output_file: Path to output file
+        max_lines: Number of trailing lines needed
+
+    Returns:
+        (tail_lines, total_lines) matching readlines() semantics
+    """
+    with open(output_file, "rb") as f:
+        # Forward pass: count lines (a trailing chunk without a final
+        # newline still counts as a line, same as readlines())
+        newlines = 0
+        last_byte = b""
+        while chunk := f.read(1 << 20):
+            newlines += chunk.count(b"\n")
+            last_byte = chunk[-1:]
+        size = f.tell()
+        total_lines = newlines + (0 if last_byte in (b"\n", b"") else 1)
+
+        # Backward pass: pull blocks until the buffer spans max_lines
+        # complete lines (one extra newline guards the partial first line)
+        buf = b""
+        pos = size
+        while pos > 0 and buf.count(b"\n") <= max_lines:
+            step = min(1 << 16, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+
+    text = buf.decode(errors="replace")
+    lines = text.splitlines(keepends=True)
+    if pos > 0 and len(lines) > max_lines:
+        # First element may be a partial line from mid-block; it can never
+        # be one of the last max_lines thanks to the loop condition
+        lines = lines[-max_lines:]
+    return lines, total_lines
+
+
 def get_output_preview(
     output_file: Path, max_lines: int = 5, max_line_length: int = 60
 ) -> tuple[list[str], int] | None:
@@ -104,10 +154,12 @@ def get_output_preview(
         (preview_lines, total_lines) if file exists, else None
     """
     try:
-        with open(output_file) as f:
-            lines = f.readlines()
-
-        total_lines = len(lines)
+        if output_file.stat().st_size > _TAIL_THRESHOLD:
+            lines, total_lines = _read_tail(output_file, max_lines)
+        else:
+            with open(output_file) as f:
+                lines = f.readlines()
+            total_lines = len(lines)
 
         # Get last N lines (or all if fewer)
         preview = lines[-max_lines:] if len(lines) > max_lines else lines
@@ -0,0 +1,33 @@
+"""Modal help screen for textual-cmdorc.
+
+Kept out of cmdorc_app.py so the app module stays focused on
+orchestration wiring; the screen is only imported when the user
+actually opens help.
+"""
+
+from textual.app import ComposeResult
+from textual.containers import Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Static
+
+
+class HelpScreen(ModalScreen):
+    """Modal help screen showing keyboard shortcuts."""
+
+    BINDINGS = [("escape", "dismiss", "Close")]
+
+    def __init__(self, content: str, **kwargs):
+        """Initialize help screen.
+
+        Args:
+            content: Prebuilt help text (see CmdorcApp._build_help_text)
+        """
+        super().__init__(**kwargs)
+        self.content = content
+
+    def compose(self) -> ComposeResult:
+        """Compose help content from the prebuilt text."""
+        with Vertical():
+            yield Static("# Keyboard Shortcuts", classes="help-header")
+            yield Static(self.content)
+            yield Static("Press ESC to close", classes="help-footer")
@@ -32,6 +32,15 @@ class TooltipBuilder:
             adapter: OrchestratorAdapter for accessing command state
         """
         self.adapter = adapter
+        # Shortcuts are fixed for the adapter's lifetime; cache the mapping
+        # so per-tooltip builds skip the attribute chain
+        self._shortcuts = adapter.keyboard_config.shortcuts or {}
+        # Tooltip caches - a builder lives exactly as long as its adapter's
+        # config, so reload invalidates these by constructing a new builder.
+        # Play tooltips depend only on static trigger config; output tooltips
+        # are keyed on (path, mtime) so a rerun that rewrites the file misses.
+        self._play_cache: dict[str, str] = {}
+        self._output_cache: dict[str, tuple[tuple[str, int] | None, str]] = {}
 
     # ========================================================================
     # Status Icon Tooltip Builders (Run History)
@@ -208,6 +217,10 @@ class TooltipBuilder:
         Returns:
             Formatted tooltip string
         """
+        cached = self._play_cache.get(cmd_name)
+        if cached is not None:
+            return cached
+
         try:
             lines = [f"▶️ Run {cmd_name}", ""]
 
@@ -219,7 +232,9 @@ class TooltipBuilder:
             # Get command config
             config = self.adapter.orchestrator._runtime.get_command(cmd_name)
             if not config:
-                return "\n".join(lines)
+                tooltip = "\n".join(lines)
+                self._play_cache[cmd_name] = tooltip
+                return tooltip
 
             # Triggers
             lines.append("Triggers:")
@@ -236,7 +251,7 @@ class TooltipBuilder:
                         lines.append(f"  • {trigger}")
 
             # Manual trigger
-            shortcut = self.adapter.keyboard_config.shortcuts.get(cmd_name)
+            shortcut = self._shortcuts.get(cmd_name)
             if shortcut:
                 lines.append(f"  • [{shortcut}] manual")
             else:
@@ -271,7 +286,9 @@ class TooltipBuilder:
                 if len(config.cancel_on_triggers) > 3:
                     lines.append(f"  ... and {len(config.cancel_on_triggers) - 3} more")
 
-            return "\n".join(lines)
+            tooltip = "\n".join(lines)
+            self._play_cache[cmd_name] = tooltip
+            return tooltip
 
         except Exception as e:
             logger.error(f"Failed to build play tooltip for {cmd_name}: {e}")
@@ -325,7 +342,7 @@ class TooltipBuilder:
                     lines.append(f"  {chain}")
 
             # Keyboard shortcut
-            shortcut = self.adapter.keyboard_config.shortcuts.get(cmd_name)
+            shortcut = self._shortcuts.get(cmd_name)
             if shortcut:
                 lines.append("")
                 lines.append(f"[{shortcut}] to stop")
@@ -340,6 +357,28 @@ class TooltipBuilder:
     # Command Name Tooltip Builder (Output Preview)
     # ========================================================================
 
+    def build_output_tooltip_initial(self, cmd_name: str) -> str:
+        """Build a lightweight output tooltip without touching the file.
+
+        Mount and reload use this so startup cost never scales with
+        command count x output-file size; the full preview (with its tail
+        read) is built when a run actually completes.
+
+        Args:
+            cmd_name: Command name
+
+        Returns:
+            Formatted tooltip string
+        """
+        try:
+            status = self.adapter.orchestrator.get_status(cmd_name)
+            if not status or not status.last_run or not status.last_run.output_file:
+                return f"{cmd_name}\n\nNo output available yet"
+            return f"{cmd_name}\n\nOpen: {status.last_run.output_file}\nClick to open in editor"
+        except Exception as e:
+            logger.error(f"Failed to build initial output tooltip for {cmd_name}: {e}")
+            return cmd_name
+
     def build_output_tooltip(self, cmd_name: str) -> str:
         """Build tooltip for command name (output preview).
 
@@ -365,6 +404,17 @@ class TooltipBuilder:
 
             output_file = status.last_run.output_file
 
+            # Reuse the cached preview unless the file was rewritten since -
+            # (path, mtime) keying means a rerun that touches the file misses
+            try:
+                key = (str(output_file), output_file.stat().st_mtime_ns)
+            except OSError:
+                key = None
+            if key is not None:
+                cached = self._output_cache.get(cmd_name)
+                if cached is not None and cached[0] == key:
+                    return cached[1]
+
             # Get preview using formatting utility
             preview_data = get_output_preview(output_file, max_lines=5, max_line_length=60)
 
@@ -396,7 +446,10 @@ class TooltipBuilder:
 
             lines.append("Click to open in editor")
 
-            return "\n".join(lines)
+            tooltip = "\n".join(lines)
+            if key is not None:
+                self._output_cache[cmd_name] = (key, tooltip)
+            return tooltip
 
         except Exception as e:
             logger.error(f"Failed to build output tooltip for {cmd_name}: {e}")
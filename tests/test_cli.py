@@ -57,9 +57,9 @@ class TestCreateDefaultConfig:
         with TemporaryDirectory() as tmpdir:
             config_path = Path(tmpdir) / "config.toml"
 
-            # Mock Path.write_text to raise PermissionError
+            # Mock Path.write_bytes to raise PermissionError
             with (
-                patch.object(Path, "write_text", side_effect=PermissionError("Access denied")),
+                patch.object(Path, "write_bytes", side_effect=PermissionError("Access denied")),
                 pytest.raises(PermissionError),
             ):
                 create_default_config(config_path)
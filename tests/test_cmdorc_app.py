@@ -249,8 +249,8 @@ class TestCmdorcAppReload:
     """Test configuration reload functionality."""
 
     @pytest.mark.asyncio
-    async def test_reload_config_awaits_removal(self, mock_adapter, mock_config_path):
-        """Test that reload awaits file_list.remove()."""
+    async def test_reload_config_reuses_file_list(self, mock_adapter, mock_config_path):
+        """Test that reload keeps the mounted file_list instead of removing it."""
         with patch("textual_cmdorc.cmdorc_app.OrchestratorAdapter", return_value=mock_adapter):
             app = CmdorcApp(config_path=mock_config_path)
 
@@ -271,8 +271,11 @@ class TestCmdorcAppReload:
             # Call reload
             await app.action_reload_config()
 
-            # Verify remove was awaited
-            mock_file_list.remove.assert_awaited_once()
+            # The list widget survives; items are rebuilt in place
+            mock_file_list.remove.assert_not_awaited()
+            app.mount.assert_not_awaited()
+            mock_file_list.clear_items.assert_called_once()
+            assert mock_file_list.add_item.call_count == len(mock_adapter.get_command_names())
 
     @pytest.mark.asyncio
     async def test_reload_config_detaches_old_adapter(self, mock_adapter, mock_config_path):
@@ -5,6 +5,7 @@ from pathlib import Path
 from tempfile import NamedTemporaryFile
 
 from textual_cmdorc.formatting import (
+    _TAIL_THRESHOLD,
     format_elapsed_time,
     format_time_ago,
     get_output_preview,
@@ -238,3 +239,61 @@ class TestGetOutputPreview:
             assert preview_lines[0] == "a" * 20 + "..."
         finally:
             file_path.unlink()
+
+
+class TestGetOutputPreviewLargeFile:
+    """Tests for the bounded tail-read path taken above _TAIL_THRESHOLD."""
+
+    def test_get_output_preview_large_file(self):
+        """Test that a file over the threshold returns the correct tail."""
+        with NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            line_count = 10_000  # ~98 KiB, comfortably over the threshold
+            for i in range(line_count):
+                f.write(f"Line {i}\n")
+            f.flush()
+            file_path = Path(f.name)
+
+        try:
+            assert file_path.stat().st_size > _TAIL_THRESHOLD
+            preview_lines, total_lines = get_output_preview(file_path, max_lines=3)
+            assert total_lines == line_count
+            assert preview_lines == [
+                f"Line {line_count - 3}",
+                f"Line {line_count - 2}",
+                f"Line {line_count - 1}",
+            ]
+        finally:
+            file_path.unlink()
+
+    def test_get_output_preview_large_file_no_trailing_newline(self):
+        """Test that an unterminated final line still counts as a line."""
+        with NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            line_count = 10_000
+            for i in range(line_count):
+                f.write(f"Line {i}\n")
+            f.write("partial")  # No trailing newline
+            f.flush()
+            file_path = Path(f.name)
+
+        try:
+            assert file_path.stat().st_size > _TAIL_THRESHOLD
+            preview_lines, total_lines = get_output_preview(file_path, max_lines=2)
+            assert total_lines == line_count + 1
+            assert preview_lines == [f"Line {line_count - 1}", "partial"]
+        finally:
+            file_path.unlink()
+
+    def test_get_output_preview_large_single_line(self):
+        """Test with one line longer than the backward read block."""
+        with NamedTemporaryFile(mode="w", delete=False, suffix=".txt") as f:
+            f.write("a" * (_TAIL_THRESHOLD * 3) + "\n")
+            f.flush()
+            file_path = Path(f.name)
+
+        try:
+            preview_lines, total_lines = get_output_preview(file_path, max_lines=5, max_line_length=60)
+            assert total_lines == 1
+            assert len(preview_lines) == 1
+            assert preview_lines[0] == "a" * 60 + "..."
+        finally:
+            file_path.unlink()